@@ -13,6 +13,7 @@ from textual.widget import Widget
 from textual.widgets import Footer, Header, Static
 
 from .config import AppConfig, load_config, save_config
+from .connections import shutdown_shared_loop
 from .plugins import (
     CommandCapability,
     MetadataHookCapability,
@@ -46,7 +47,12 @@ def _load_app_config() -> AppConfig:
 class PsqluiApp(App[None]):
     """Minimal Textual shell that will grow into the full TUI."""
 
-    COMMANDS = App.COMMANDS | {PluginCommandProvider, PluginToggleProvider, ProfileSwitchProvider, SessionRefreshProvider}
+    COMMANDS = App.COMMANDS | {
+        PluginCommandProvider,
+        PluginToggleProvider,
+        ProfileSwitchProvider,
+        SessionRefreshProvider,
+    }
     CSS = """
     Screen {
         layout: vertical;
@@ -62,10 +68,6 @@ class PsqluiApp(App[None]):
         border-left: solid $surface-darken-1;
         border-right: solid $surface-darken-1;
     }
-    NavigationSidebar {
-        width: 28;
-        min-width: 22;
-    }
     #plugin-sidebar {
         width: 32;
         min-width: 24;
@@ -93,7 +95,9 @@ class PsqluiApp(App[None]):
         self._sql_service = SqlIntelService()
         self._session_manager = SessionManager(self._sql_service, config=self._config)
         if self._session_manager.state:
-            self._config = self._config.with_active_profile(self._session_manager.state.profile.name)
+            self._config = self._config.with_active_profile(
+                self._session_manager.state.profile.name
+            )
         self._session_unsubscribe: Callable[[], None] | None = None
         self._last_session_state: SessionState | None = None
         self._pending_notifications: list[tuple[str, str]] = []
@@ -235,13 +239,18 @@ class PsqluiApp(App[None]):
         hooks: list[MetadataHookCapability] = []
         for plugin in self._plugin_loader.loaded:
             for capability in plugin.capabilities:
-                if isinstance(capability, MetadataHookCapability) and capability.handler is not None:
+                if (
+                    isinstance(capability, MetadataHookCapability)
+                    and capability.handler is not None
+                ):
                     hooks.append(capability)
         return hooks
 
     def _mount_plugin_panes(self) -> list[Widget]:
         panes: list[Widget] = []
-        context = self._plugin_context or PluginContext(app=self, sql_intel=self._sql_service, config=self._config)
+        context = self._plugin_context or PluginContext(
+            app=self, sql_intel=self._sql_service, config=self._config
+        )
         for plugin in self._plugin_loader.loaded:
             for capability in plugin.capabilities:
                 if isinstance(capability, PaneCapability) and capability.mount is not None:
@@ -324,7 +333,10 @@ class PsqluiApp(App[None]):
 def main() -> None:
     """Invoke the Textual application."""
 
-    PsqluiApp().run()
+    try:
+        PsqluiApp().run()
+    finally:
+        shutdown_shared_loop()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 import tomllib
@@ -20,7 +21,11 @@ class LayoutState(BaseModel):
 
 
 class ConnectionProfileConfig(BaseModel):
-    """Connection profile configuration stored in config.toml."""
+    """Connection profile configuration stored in config.toml.
+
+    ``metadata`` is treated as read-only: runtime profiles share it by reference
+    when its column lists are already tuples (as produced by ``load_config``).
+    """
 
     name: str
     dsn: str | None = None
@@ -38,35 +43,38 @@ class AppConfig(BaseModel):
     theme: str = "dark"
     telemetry_enabled: bool = False
     plugins: dict[str, bool] = Field(default_factory=dict)
-    profiles: list[ConnectionProfileConfig] = Field(default_factory=lambda: list(_default_profiles()))
+    profiles: list[ConnectionProfileConfig] = Field(
+        default_factory=lambda: list(_default_profiles())
+    )
     active_profile: str | None = None
     layout: LayoutState = Field(default_factory=LayoutState)
 
     def plugin_filters(self) -> tuple[set[str] | None, set[str]]:
         """Return allow/block lists for plugin enablement."""
 
-        allowed = {name for name, flag in self.plugins.items() if flag}
-        disabled = {name for name, flag in self.plugins.items() if not flag}
+        allowed: set[str] = set()
+        disabled: set[str] = set()
+        for name, flag in self.plugins.items():
+            (allowed if flag else disabled).add(name)
         allowlist: set[str] | None = allowed or None
         return allowlist, disabled
 
     def enabled_plugins(self) -> set[str] | None:
         """Maintain compatibility with legacy loader API."""
 
-        allowlist, _ = self.plugin_filters()
-        return allowlist
+        return {name for name, flag in self.plugins.items() if flag} or None
 
     def disabled_plugins(self) -> set[str]:
         """Plugins explicitly disabled in config."""
 
-        _, disabled = self.plugin_filters()
-        return disabled
+        return {name for name, flag in self.plugins.items() if not flag}
 
     def is_plugin_enabled(self, name: str) -> bool:
-        allowlist, disabled = self.plugin_filters()
-        if allowlist is not None:
-            return name in allowlist
-        return name not in disabled
+        flag = self.plugins.get(name)
+        if flag is not None:
+            return flag
+        # Unlisted plugins are only enabled when no allowlist is in effect.
+        return not any(self.plugins.values())
 
     def with_plugin_enabled(self, name: str, enabled: bool) -> AppConfig:
         """Return a copy with the given plugin flag updated."""
@@ -94,7 +102,8 @@ def load_config() -> AppConfig:
     """Load configuration from disk; fall back to defaults if missing."""
 
     try:
-        data = _read_config_file()
+        stat = CONFIG_FILE.stat()
+        data = _read_config_file(CONFIG_FILE, stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
         return AppConfig()
     except (tomllib.TOMLDecodeError, OSError):
@@ -117,7 +126,7 @@ def load_config() -> AppConfig:
         plugins=data.get("plugins", {}),
         profiles=profiles if profiles is not None else list(_default_profiles()),
         active_profile=data.get("active_profile"),
-        layout=data.get("layout", LayoutState()),
+        layout=LayoutState(**data.get("layout", {})),  # type: ignore[arg-type]
     )
 
 
@@ -160,12 +169,24 @@ def save_config(config: AppConfig) -> None:
         for name in sorted(config.plugins):
             flag = "true" if config.plugins[name] else "false"
             lines.append(f"{name} = {flag}")
-    CONFIG_FILE.write_text("\n".join(lines) + "\n")
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+    CONFIG_FILE.write_bytes(payload)
+    # A rewrite can land within the filesystem's mtime granularity.
+    _read_config_file.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _read_config_file(path: Path, mtime_ns: int, size: int) -> dict[str, object]:
+    """Load ``path``; cached on its stat signature so unchanged files are read once.
+
+    Callers must treat the result as read-only since it is shared between loads.
+    """
+
+    return _parse_config(path.read_bytes())
 
 
-def _read_config_file() -> dict[str, object]:
-    with CONFIG_FILE.open("rb") as handle:
-        raw = tomllib.load(handle)
+def _parse_config(payload: bytes) -> dict[str, object]:
+    raw = tomllib.loads(payload.decode("utf-8"))
     data: dict[str, object] = {}
     if isinstance(raw, dict):
         theme = raw.get("theme")
@@ -214,7 +235,7 @@ def _read_config_file() -> dict[str, object]:
             sidebar_width = layout.get("sidebar_width")
             if isinstance(sidebar_width, int):
                 state["sidebar_width"] = sidebar_width
-            data["layout"] = LayoutState(**state)
+            data["layout"] = state
     return data
 
 
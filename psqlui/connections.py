@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+import json
 import random
+import sys
 import threading
 import time
+from types import MappingProxyType
 from typing import Any, Callable, Coroutine, Mapping, Protocol, Sequence, runtime_checkable
+import weakref
 
 import asyncpg
 
@@ -46,44 +52,123 @@ class ConnectionEvent:
 
 MetadataListener = Callable[["ConnectionProfile", ConnectionEvent], None]
 
+_shared_loop: asyncio.AbstractEventLoop | None = None
+_shared_loop_thread: threading.Thread | None = None
+_shared_loop_lock = threading.Lock()
+# Live backends, so shutting the loop down can close their pools first.
+_backends: weakref.WeakSet[AsyncpgConnectionBackend] = weakref.WeakSet()
+
+
+def _get_shared_loop() -> asyncio.AbstractEventLoop:
+    """Return the background loop shared by every asyncpg backend, starting it lazily."""
+
+    global _shared_loop, _shared_loop_thread
+    with _shared_loop_lock:
+        if _shared_loop is None or _shared_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="psqlui-asyncpg-backend", daemon=True
+            )
+            thread.start()
+            _shared_loop, _shared_loop_thread = loop, thread
+        return _shared_loop
+
+
+def shutdown_shared_loop() -> None:
+    """Close every backend's pools, then stop and close the shared backend loop.
+
+    Backends stay usable: their next connect or refresh starts a fresh loop.
+    """
+
+    global _shared_loop, _shared_loop_thread
+    with _shared_loop_lock:
+        loop, thread = _shared_loop, _shared_loop_thread
+        _shared_loop = _shared_loop_thread = None
+    if loop is None:
+        return
+    if loop.is_running():
+        for backend in tuple(_backends):
+            backend.shutdown()
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1)
+    if not loop.is_running() and not loop.is_closed():
+        loop.close()
+
+
+def _on_loop(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
 
 class AsyncpgConnectionBackend:
     """Connection backend that queries PostgreSQL via asyncpg."""
 
-    _METADATA_QUERY = """
-        SELECT table_schema, table_name, column_name
-        FROM information_schema.columns
-        WHERE table_schema NOT IN ('pg_catalog', 'information_schema')
-        ORDER BY table_schema, table_name, ordinal_position
+    # Schemas and columns come back together as one JSON document so a refresh
+    # costs a single round-trip. Columns arrive as three parallel arrays
+    # (schema, table, column) sharing one ordering, not one object per row.
+    # The catalogs are read directly: the information_schema views wrap them in
+    # far heavier joins, so the privilege checks they apply are spelled out here.
+    _METADATA_QUERY = r"""
+        SELECT json_build_object(
+            'schemas', COALESCE((
+                SELECT json_agg(n.nspname ORDER BY n.nspname)
+                FROM pg_catalog.pg_namespace n
+                WHERE n.nspname NOT LIKE 'pg\_%'
+                  AND n.nspname <> 'information_schema'
+                  AND has_schema_privilege(n.oid, 'USAGE')
+            ), '[]'::json),
+            'columns', (
+                SELECT json_build_object(
+                    'schema', json_agg(n.nspname ORDER BY n.nspname, c.relname, a.attnum),
+                    'table', json_agg(c.relname ORDER BY n.nspname, c.relname, a.attnum),
+                    'column', json_agg(a.attname ORDER BY n.nspname, c.relname, a.attnum)
+                )
+                FROM pg_catalog.pg_attribute a
+                JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE a.attnum > 0
+                  AND NOT a.attisdropped
+                  AND c.relkind IN ('r', 'v', 'm', 'p', 'f')
+                  AND n.nspname NOT LIKE 'pg\_%'
+                  AND n.nspname <> 'information_schema'
+                  AND has_column_privilege(c.oid, a.attnum, 'SELECT, INSERT, UPDATE, REFERENCES')
+            )
+        ) AS payload
     """
 
-    _SCHEMA_QUERY = """
-        SELECT schema_name
-        FROM information_schema.schemata
-        WHERE schema_name NOT IN ('pg_catalog', 'information_schema')
-        ORDER BY schema_name
-    """
+    def __init__(self, *, payload_query: str | None = None, connect_timeout: float = 3.0) -> None:
+        """Create a backend.
+
+        ``payload_query`` replaces the built-in metadata query. It must return one
+        row whose ``payload`` column is JSON shaped like
+        ``{"schemas": [...], "columns": {"schema": [...], "table": [...], "column": [...]}}``,
+        the column arrays being parallel and grouped by table.
+        """
 
-    def __init__(self, metadata_query: str | None = None, *, connect_timeout: float = 3.0) -> None:
-        self._metadata_query = metadata_query or self._METADATA_QUERY
-        self._schema_query = self._SCHEMA_QUERY
+        self._metadata_query = payload_query or self._METADATA_QUERY
         self._connect_timeout = connect_timeout
+        # Last schema tuple per profile; unchanged schema sets skip the re-sort and
+        # hand the session the same tuple it already holds.
+        self._schema_lists: dict[str, tuple[str, ...]] = {}
         self._listeners: set[MetadataListener] = set()
-        self._loop = asyncio.new_event_loop()
-        self._loop_thread = threading.Thread(
-            target=self._loop.run_forever,
-            name="psqlui-asyncpg-backend",
-            daemon=True,
-        )
-        self._loop_thread.start()
+        # One small pool per distinct set of connection parameters, so refreshes
+        # reuse an authenticated connection instead of reconnecting.
+        self._pools: dict[tuple[tuple[str, object], ...], asyncpg.Pool] = {}
+        # Loop the pools were created on; re-checked per call since the shared
+        # loop can be shut down and restarted underneath a live backend.
+        self._loop = _get_shared_loop()
+        _backends.add(self)
 
     def connect(self, profile: "ConnectionProfile") -> ConnectionEvent:
-        event = self._run(self._connect(profile))
+        event = self._run(self._load_event(profile, "Connected"))
         self._emit(profile, event)
         return event
 
     def refresh(self, profile: "ConnectionProfile") -> None:
-        event = self._run(self._refresh(profile))
+        event = self._run(self._load_event(profile, "Healthy"))
         self._emit(profile, event)
 
     def subscribe(self, listener: MetadataListener) -> Callable[[], None]:
@@ -95,12 +180,20 @@ class AsyncpgConnectionBackend:
         return _unsubscribe
 
     def shutdown(self) -> None:
-        """Stop the background event loop (testing helper)."""
+        """Close this backend's connection pools; the shared loop keeps running."""
 
-        if not self._loop.is_running():  # pragma: no cover - defensive
+        loop = self._loop
+        if not self._pools or not loop.is_running():
+            return
+        future = asyncio.run_coroutine_threadsafe(self._close_pools(), loop)
+        if _on_loop(loop):
+            # Called from the loop itself (e.g. __del__ during a GC pass there):
+            # waiting would stall every backend, so let the close run on its own.
             return
-        self._loop.call_soon_threadsafe(self._loop.stop)
-        self._loop_thread.join(timeout=1)
+        try:
+            future.result(timeout=2)
+        except Exception:  # pragma: no cover - best effort
+            pass
 
     def __del__(self) -> None:  # pragma: no cover - best effort cleanup
         try:
@@ -113,58 +206,83 @@ class AsyncpgConnectionBackend:
             listener(profile, event)
 
     def _run(self, coro: Coroutine[Any, Any, ConnectionEvent]) -> ConnectionEvent:
-        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        loop = _get_shared_loop()
+        if loop is not self._loop:
+            # The old loop was shut down; pools bound to it cannot be reused.
+            self._loop, self._pools = loop, {}
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
         return future.result()
 
-    async def _connect(self, profile: "ConnectionProfile") -> ConnectionEvent:
-        metadata, schemas, latency_ms = await self._fetch_metadata(profile)
-        return ConnectionEvent(
-            metadata=metadata,
-            schemas=schemas,
-            status="Connected",
-            latency_ms=latency_ms,
-            connected_at=datetime.now(tz=timezone.utc),
-        )
-
-    async def _refresh(self, profile: "ConnectionProfile") -> ConnectionEvent:
+    async def _load_event(self, profile: "ConnectionProfile", status: str) -> ConnectionEvent:
+        # Acquiring a connection and fetching metadata share one await chain, so
+        # each connect/refresh is a single trip onto the backend loop.
         metadata, schemas, latency_ms = await self._fetch_metadata(profile)
         return ConnectionEvent(
             metadata=metadata,
             schemas=schemas,
-            status="Healthy",
+            status=status,
             latency_ms=latency_ms,
             connected_at=datetime.now(tz=timezone.utc),
         )
 
-    async def _fetch_metadata(self, profile: "ConnectionProfile") -> tuple[MetadataSnapshot, tuple[str, ...], int]:
+    async def _fetch_metadata(
+        self, profile: "ConnectionProfile"
+    ) -> tuple[MetadataSnapshot, tuple[str, ...], int]:
         started = time.perf_counter()
-        conn = await self._connect_profile(profile)
+        pool = await self._pool_for(profile)
         try:
-            rows = await conn.fetch(self._metadata_query)
-            schema_rows = await conn.fetch(self._schema_query)
+            async with pool.acquire(timeout=self._connect_timeout) as conn:
+                # asyncpg keeps a per-connection cache of prepared statements, so on a
+                # pooled connection repeat refreshes skip parsing and planning.
+                row = await conn.fetchrow(self._metadata_query)
+            payload = json.loads(row["payload"]) if row is not None else {}
         except Exception as exc:
-            raise ConnectionBackendError(f"Failed to fetch metadata for '{profile.name}': {exc}") from exc
-        finally:
-            try:
-                await conn.close()
-            except Exception:  # pragma: no cover - best effort
-                pass
+            raise ConnectionBackendError(
+                f"Failed to fetch metadata for '{profile.name}': {exc}"
+            ) from exc
+        if not isinstance(payload, dict) or not isinstance(payload.get("columns") or {}, dict):
+            raise ConnectionBackendError(
+                f"Metadata query for '{profile.name}' must return a JSON 'payload' object "
+                "with 'schemas' and 'columns' keys."
+            )
         latency_ms = int((time.perf_counter() - started) * 1000)
-        metadata: dict[str, list[str]] = {}
+        # defaultdict allocates a column list once per table, not a throwaway per row.
+        metadata: defaultdict[str, list[str]] = defaultdict(list)
         schemas: set[str] = set()
-        for row in rows:
-            schema = str(row["table_schema"])
-            table = str(row["table_name"])
-            column = str(row["column_name"])
-            key = f"{schema}.{table}"
-            metadata.setdefault(key, []).append(column)
-            schemas.add(schema)
-        for row in schema_rows:
-            schemas.add(str(row["schema_name"]))
-        schema_list = tuple(sorted(schemas)) or ("public",)
-        return {table: tuple(columns) for table, columns in metadata.items()}, schema_list, latency_ms
-
-    async def _connect_profile(self, profile: "ConnectionProfile"):
+        columns = payload.get("columns") or {}
+        last_schema: object = None
+        last_table: object = None
+        current: list[str] = []
+        for schema, table, column in zip(
+            columns.get("schema") or (),
+            columns.get("table") or (),
+            columns.get("column") or (),
+        ):
+            if table != last_table or schema != last_schema:
+                # Rows arrive grouped by table, so the "schema.table" key is only
+                # formatted when a new table starts.
+                last_schema, last_table = schema, table
+                current = metadata[f"{schema}.{table}"]
+                schemas.add(str(schema))
+            current.append(sys.intern(str(column)))
+        for schema in payload.get("schemas") or ():
+            schemas.add(str(schema))
+        schema_list = self._schema_lists.get(profile.name)
+        if (
+            schema_list is None
+            or len(schema_list) != len(schemas)
+            or not schemas.issuperset(schema_list)
+        ):
+            schema_list = self._schema_lists[profile.name] = tuple(sorted(schemas)) or ("public",)
+        # Tables often repeat the same column list (id, created_at, ...); share the tuples.
+        column_lists: dict[tuple[str, ...], tuple[str, ...]] = {}
+        snapshot: dict[str, tuple[str, ...]] = {}
+        for table, columns in metadata.items():
+            key = tuple(columns)
+            snapshot[table] = column_lists.setdefault(key, key)
+        return snapshot, schema_list, latency_ms
+
+    async def _pool_for(self, profile: "ConnectionProfile") -> asyncpg.Pool:
         kwargs: dict[str, object] = {}
         if profile.dsn:
             kwargs["dsn"] = profile.dsn
@@ -176,37 +294,81 @@ class AsyncpgConnectionBackend:
                 kwargs["user"] = profile.user
             if profile.database:
                 kwargs["database"] = profile.database
+        key = tuple(sorted(kwargs.items()))
+        pool = self._pools.get(key)
+        if pool is not None:
+            return pool
         kwargs.setdefault("timeout", self._connect_timeout)
         try:
-            return await asyncpg.connect(**kwargs)
+            pool = await asyncpg.create_pool(min_size=1, max_size=4, **kwargs)
         except Exception as exc:  # pragma: no cover - exercised via tests
-            raise ConnectionBackendError(f"Failed to connect to profile '{profile.name}': {exc}") from exc
-
-
-DEMO_METADATA_PRESETS: Mapping[str, Sequence[Mapping[str, Sequence[str]]]] = {
-    "demo": (
-        {
-            "public.accounts": ("id", "email", "last_login"),
-            "public.orders": ("id", "account_id", "total"),
-            "public.payments": ("id", "order_id", "amount"),
-        },
-        {
-            "public.accounts": ("id", "email", "last_login", "status"),
-            "public.orders": ("id", "account_id", "total", "currency"),
-            "public.payments": ("id", "order_id", "amount"),
-        },
-    ),
-    "analytics": (
-        {
-            "analytics.sessions": ("id", "user_id", "started_at", "device"),
-            "analytics.events": ("id", "session_id", "name", "payload"),
-        },
+            raise ConnectionBackendError(
+                f"Failed to connect to profile '{profile.name}': {exc}"
+            ) from exc
+        self._pools[key] = pool
+        return pool
+
+    async def _close_pools(self) -> None:
+        pools, self._pools = tuple(self._pools.values()), {}
+        for pool in pools:
+            try:
+                await asyncio.wait_for(pool.close(), timeout=1)
+            except Exception:  # pragma: no cover - best effort
+                pool.terminate()
+
+
+DEMO_METADATA_PRESETS: Mapping[str, Sequence[Mapping[str, Sequence[str]]]] = MappingProxyType(
+    {
+        "demo": (
+            {
+                "public.accounts": ("id", "email", "last_login"),
+                "public.orders": ("id", "account_id", "total"),
+                "public.payments": ("id", "order_id", "amount"),
+            },
+            {
+                "public.accounts": ("id", "email", "last_login", "status"),
+                "public.orders": ("id", "account_id", "total", "currency"),
+                "public.payments": ("id", "order_id", "amount"),
+            },
+        ),
+        "analytics": (
+            {
+                "analytics.sessions": ("id", "user_id", "started_at", "device"),
+                "analytics.events": ("id", "session_id", "name", "payload"),
+            },
+            {
+                "analytics.sessions": ("id", "user_id", "started_at", "device", "country"),
+                "analytics.events": ("id", "session_id", "name", "payload", "metadata"),
+            },
+        ),
+    }
+)
+
+
+def _normalize_snapshot(
+    snapshot: Mapping[str, Sequence[str]],
+    column_lists: dict[tuple[str, ...], tuple[str, ...]],
+) -> MetadataSnapshot:
+    shared = column_lists.setdefault
+    normalized: dict[str, tuple[str, ...]] = {}
+    for table, columns in snapshot.items():
+        key = tuple(map(sys.intern, columns))
+        normalized[sys.intern(table)] = shared(key, key)
+    # Snapshots are handed to every subscriber as-is; the proxy keeps them intact.
+    return MappingProxyType(normalized)
+
+
+@lru_cache(maxsize=1)
+def _default_demo_presets() -> Mapping[str, tuple[MetadataSnapshot, ...]]:
+    # The built-in presets never change and their snapshots are read-only, so
+    # every backend built on the defaults shares one normalized copy.
+    column_lists: dict[tuple[str, ...], tuple[str, ...]] = {}
+    return MappingProxyType(
         {
-            "analytics.sessions": ("id", "user_id", "started_at", "device", "country"),
-            "analytics.events": ("id", "session_id", "name", "payload", "metadata"),
-        },
-    ),
-}
+            key: tuple(_normalize_snapshot(snapshot, column_lists) for snapshot in snapshots)
+            for key, snapshots in DEMO_METADATA_PRESETS.items()
+        }
+    )
 
 
 class DemoConnectionBackend:
@@ -216,12 +378,20 @@ class DemoConnectionBackend:
         self,
         metadata_sequences: Mapping[str, Sequence[Mapping[str, Sequence[str]]]] | None = None,
     ) -> None:
-        sources = metadata_sequences or DEMO_METADATA_PRESETS
-        self._presets: dict[str, tuple[MetadataSnapshot, ...]] = {
-            key: tuple(self._normalize(snapshot) for snapshot in snapshots)
-            for key, snapshots in sources.items()
-        }
+        # Equal column lists across tables and snapshots share one tuple.
+        self._column_lists: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self._presets: Mapping[str, tuple[MetadataSnapshot, ...]]
+        if metadata_sequences:
+            self._presets = {
+                key: tuple(self._normalize(snapshot) for snapshot in snapshots)
+                for key, snapshots in metadata_sequences.items()
+            }
+        else:
+            self._presets = _default_demo_presets()
         self._cursors: dict[str, int] = {key: 0 for key in self._presets}
+        # Normalized inline profile metadata, keyed by profile name and tagged
+        # with the source mapping it was built from.
+        self._inline: dict[str, tuple[Mapping[str, Sequence[str]], MetadataSnapshot]] = {}
         self._listeners: set[MetadataListener] = set()
 
     def connect(self, profile: "ConnectionProfile") -> ConnectionEvent:
@@ -240,7 +410,9 @@ class DemoConnectionBackend:
         event = self._build_event(profile, metadata, status=status)
         self._emit(profile, event)
 
-    def emit_metadata(self, profile: "ConnectionProfile", metadata: Mapping[str, Sequence[str]]) -> None:
+    def emit_metadata(
+        self, profile: "ConnectionProfile", metadata: Mapping[str, Sequence[str]]
+    ) -> None:
         """Push a custom metadata snapshot to listeners (testing helper)."""
 
         event = self._build_event(profile, self._normalize(metadata), status="Updated")
@@ -258,10 +430,12 @@ class DemoConnectionBackend:
 
     def _metadata_for(self, profile: "ConnectionProfile", *, advance: bool) -> MetadataSnapshot:
         if profile.metadata:
-            return {
-                table: tuple(columns)
-                for table, columns in profile.metadata.items()
-            }
+            cached = self._inline.get(profile.name)
+            if cached is not None and cached[0] is profile.metadata:
+                return cached[1]
+            snapshot = self._normalize(profile.metadata)
+            self._inline[profile.name] = (profile.metadata, snapshot)
+            return snapshot
         key = profile.metadata_key or profile.name
         snapshots = self._presets.get(key)
         if not snapshots:
@@ -292,12 +466,8 @@ class DemoConnectionBackend:
             connected_at=datetime.now(tz=timezone.utc),
         )
 
-    @staticmethod
-    def _normalize(snapshot: Mapping[str, Sequence[str]]) -> MetadataSnapshot:
-        return {
-            table: tuple(columns)
-            for table, columns in snapshot.items()
-        }
+    def _normalize(self, snapshot: Mapping[str, Sequence[str]]) -> MetadataSnapshot:
+        return _normalize_snapshot(snapshot, self._column_lists)
 
     def _latency_for(self, profile: "ConnectionProfile") -> int:
         key = profile.metadata_key or profile.name
@@ -305,7 +475,9 @@ class DemoConnectionBackend:
         jitter = random.randint(0, 15)
         return base + jitter
 
-    def _schemas_for(self, profile: "ConnectionProfile", metadata: MetadataSnapshot) -> tuple[str, ...]:
+    def _schemas_for(
+        self, profile: "ConnectionProfile", metadata: MetadataSnapshot
+    ) -> tuple[str, ...]:
         schemas: set[str] = set()
         for table in metadata:
             if "." in table:
@@ -326,4 +498,5 @@ __all__ = [
     "DemoConnectionBackend",
     "DEMO_METADATA_PRESETS",
     "MetadataSnapshot",
+    "shutdown_shared_loop",
 ]
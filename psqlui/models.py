@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Mapping
 
 MetadataSnapshot = Mapping[str, tuple[str, ...]]
@@ -19,7 +19,9 @@ class ConnectionProfile:
     database: str | None = None
     user: str | None = None
     metadata_key: str | None = None
-    metadata: MetadataSnapshot | None = None
+    # Mappings are unhashable; leaving metadata out of the hash (it still takes
+    # part in ==) keeps profiles usable as dict keys and set members.
+    metadata: MetadataSnapshot | None = field(default=None, hash=False)
 
 
 __all__ = ["ConnectionProfile", "MetadataSnapshot"]
@@ -22,6 +22,10 @@ LOG = logging.getLogger(__name__)
 
 ENTRY_POINT_GROUP = "psqlui.plugins"
 
+# Resolved entry point targets keyed by (group, value); importing and walking
+# the attribute path only needs to happen once per process.
+_RESOLVED_ENTRY_POINTS: dict[tuple[str, str], object] = {}
+
 
 def _parse_version(value: str) -> tuple[int, int, int]:
     """Parse a dotted string into a comparable tuple."""
@@ -38,21 +42,69 @@ def _parse_version(value: str) -> tuple[int, int, int]:
     return ints[0], ints[1], ints[2]
 
 
-@dataclass(slots=True, frozen=True)
+def _resolve_descriptor(entry_point: metadata.EntryPoint) -> PluginDescriptor:
+    key = (entry_point.group, entry_point.value)
+    obj = _RESOLVED_ENTRY_POINTS.get(key)
+    if obj is None:
+        obj = _RESOLVED_ENTRY_POINTS[key] = entry_point.load()
+    if inspect.isclass(obj):
+        return obj()  # type: ignore[call-arg]
+    return obj  # type: ignore[return-value]
+
+
 class DiscoveredPlugin:
-    """Metadata captured from entry point discovery."""
+    """Metadata captured from entry point discovery.
 
-    name: str
-    version: str
-    min_core: str
-    entry_point: metadata.EntryPoint
-    descriptor: PluginDescriptor
+    Entry point plugins are identified by the entry point name, which must match
+    the descriptor's ``name``; the module is only imported once ``descriptor``,
+    ``version`` or ``min_core`` is read.
+    """
+
+    __slots__ = ("name", "entry_point", "_descriptor")
+
+    def __init__(
+        self,
+        name: str,
+        entry_point: metadata.EntryPoint,
+        descriptor: PluginDescriptor | None = None,
+    ) -> None:
+        self.name = name
+        self.entry_point = entry_point
+        self._descriptor = descriptor
+
+    @property
+    def descriptor(self) -> PluginDescriptor:
+        if self._descriptor is None:
+            self._descriptor = _resolve_descriptor(self.entry_point)
+        return self._descriptor
+
+    @property
+    def version(self) -> str:
+        return self.descriptor.version
+
+    @property
+    def min_core(self) -> str:
+        return getattr(self.descriptor, "min_core", "0.0.0")
+
+    @property
+    def resolved(self) -> bool:
+        """Whether the plugin module has been imported yet."""
+
+        return self._descriptor is not None
+
+    def __repr__(self) -> str:
+        return f"DiscoveredPlugin(name={self.name!r}, entry_point={self.entry_point!r})"
 
 
 @dataclass(slots=True, frozen=True)
-class LoadedPlugin(DiscoveredPlugin):
+class LoadedPlugin:
     """Container for a registered plugin and its capabilities."""
 
+    name: str
+    version: str
+    min_core: str
+    entry_point: metadata.EntryPoint
+    descriptor: PluginDescriptor
     capabilities: Sequence[CapabilitySpec] = field(default_factory=tuple)
 
 
@@ -72,7 +124,9 @@ class PluginLoader:
         self._ctx = ctx
         self._core_version = core_version
         self._entry_point_group = entry_point_group
-        self._enabled: set[str] | None = set(enabled_plugins) if enabled_plugins is not None else None
+        self._enabled: set[str] | None = (
+            set(enabled_plugins) if enabled_plugins is not None else None
+        )
         self._disabled = set(disabled_plugins or [])
         self._builtin_plugins = list(builtin_plugins or [])
         self._discovered: list[DiscoveredPlugin] = []
@@ -85,14 +139,7 @@ class PluginLoader:
         group = eps.select(group=self._entry_point_group)
         discovered: dict[str, DiscoveredPlugin] = {}
         for entry_point in sorted(group, key=lambda ep: ep.name):
-            descriptor = self._load_descriptor(entry_point)
-            discovered[descriptor.name] = DiscoveredPlugin(
-                name=descriptor.name,
-                version=descriptor.version,
-                min_core=getattr(descriptor, "min_core", "0.0.0"),
-                entry_point=entry_point,
-                descriptor=descriptor,
-            )
+            discovered[entry_point.name] = DiscoveredPlugin(entry_point.name, entry_point)
         for builtin in self._iter_builtin_plugins():
             discovered.setdefault(builtin.name, builtin)
         self._discovered = list(discovered.values())
@@ -101,42 +148,14 @@ class PluginLoader:
     def load(self) -> list[LoadedPlugin]:
         """Register capabilities for discovered plugins."""
 
-        if not self._discovered:
-            self.discover()
-
         loaded: list[LoadedPlugin] = []
-        for plugin in self._discovered:
-            if self._enabled is not None and plugin.name not in self._enabled:
-                LOG.debug("Skipping disabled plugin", extra={"plugin": plugin.name})
-                continue
-            if plugin.name in self._disabled:
-                LOG.debug("Skipping plugin due to disable list", extra={"plugin": plugin.name})
-                continue
-            try:
-                self._ensure_compatible(plugin)
-            except PluginCompatibilityError as exc:
-                LOG.warning(
-                    "Skipping plugin due to min_core mismatch",
-                    extra={"plugin": plugin.name, "min_core": plugin.min_core},
-                )
-                LOG.debug(str(exc))
-                continue
+        for plugin in self._eligible_plugins():
             try:
                 capabilities = tuple(plugin.descriptor.register(self._ctx))
             except Exception as exc:  # pragma: no cover - defensive logging path
                 LOG.exception("Plugin registration failed", extra={"plugin": plugin.name})
                 raise PluginError(f"Failed to register plugin '{plugin.name}'") from exc
-
-            loaded_plugin = LoadedPlugin(
-                name=plugin.name,
-                version=plugin.version,
-                min_core=plugin.min_core,
-                entry_point=plugin.entry_point,
-                descriptor=plugin.descriptor,
-                capabilities=capabilities,
-            )
-            self._loaded[plugin.name] = loaded_plugin
-            loaded.append(loaded_plugin)
+            loaded.append(self._record_loaded(plugin, capabilities))
         return loaded
 
     async def shutdown(self) -> None:
@@ -162,6 +181,54 @@ class PluginLoader:
             self.discover()
         return tuple(self._discovered)
 
+    def _eligible_plugins(self) -> list[DiscoveredPlugin]:
+        if not self._discovered:
+            self.discover()
+
+        eligible: list[DiscoveredPlugin] = []
+        for plugin in self._discovered:
+            if self._enabled is not None and plugin.name not in self._enabled:
+                LOG.debug("Skipping disabled plugin", extra={"plugin": plugin.name})
+                continue
+            if plugin.name in self._disabled:
+                LOG.debug("Skipping plugin due to disable list", extra={"plugin": plugin.name})
+                continue
+            # Config flags and allow/disable lists use the descriptor name; a mismatched
+            # entry point would dodge them (and could shadow a built-in), so skip it.
+            if plugin.descriptor.name != plugin.name:
+                LOG.warning(
+                    "Skipping plugin whose entry point name differs from its descriptor name",
+                    extra={"plugin": plugin.name, "descriptor_name": plugin.descriptor.name},
+                )
+                continue
+            try:
+                self._ensure_compatible(plugin)
+            except PluginCompatibilityError as exc:
+                LOG.warning(
+                    "Skipping plugin due to min_core mismatch",
+                    extra={"plugin": plugin.name, "min_core": plugin.min_core},
+                )
+                LOG.debug(str(exc))
+                continue
+            eligible.append(plugin)
+        return eligible
+
+    def _record_loaded(
+        self,
+        plugin: DiscoveredPlugin,
+        capabilities: tuple[CapabilitySpec, ...],
+    ) -> LoadedPlugin:
+        loaded_plugin = LoadedPlugin(
+            name=plugin.name,
+            version=plugin.version,
+            min_core=plugin.min_core,
+            entry_point=plugin.entry_point,
+            descriptor=plugin.descriptor,
+            capabilities=capabilities,
+        )
+        self._loaded[plugin.name] = loaded_plugin
+        return loaded_plugin
+
     def _ensure_compatible(self, plugin: DiscoveredPlugin) -> None:
         core = _parse_version(self._core_version)
         minimum = _parse_version(plugin.min_core)
@@ -170,11 +237,11 @@ class PluginLoader:
                 f"Plugin '{plugin.name}' requires core>={plugin.min_core}, found {self._core_version}"
             )
 
-    def _load_descriptor(self, entry_point: metadata.EntryPoint) -> PluginDescriptor:
-        obj = entry_point.load()
-        if inspect.isclass(obj):
-            return obj()  # type: ignore[call-arg]
-        return obj  # type: ignore[return-value]
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget resolved entry point targets so the next discovery re-imports them."""
+
+        _RESOLVED_ENTRY_POINTS.clear()
 
     def _iter_builtin_plugins(self) -> list[DiscoveredPlugin]:
         builtins: list[DiscoveredPlugin] = []
@@ -185,13 +252,5 @@ class PluginLoader:
                 value=f"{descriptor.__class__.__module__}:{descriptor.__class__.__qualname__}",
                 group=self._entry_point_group,
             )
-            builtins.append(
-                DiscoveredPlugin(
-                    name=descriptor.name,
-                    version=descriptor.version,
-                    min_core=getattr(descriptor, "min_core", "0.0.0"),
-                    entry_point=entry_point,
-                    descriptor=descriptor,
-                )
-            )
+            builtins.append(DiscoveredPlugin(descriptor.name, entry_point, descriptor))
         return builtins
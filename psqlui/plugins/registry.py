@@ -3,23 +3,34 @@
 from __future__ import annotations
 
 import inspect
-from typing import Awaitable, Iterable
+from typing import Iterable, NamedTuple
 
-from .types import CommandCapability
+from .types import CommandCapability, PluginHandler
+
+
+class _CommandEntry(NamedTuple):
+    capability: CommandCapability
+    handler: PluginHandler
+    is_async: bool
 
 
 class PluginCommandRegistry:
     """Collects command capabilities exposed by plugins."""
 
     def __init__(self) -> None:
-        self._commands: dict[str, CommandCapability] = {}
+        self._commands: dict[str, _CommandEntry] = {}
 
     def register(self, capability: CommandCapability) -> None:
         """Register a command capability."""
 
-        if capability.handler is None:
+        handler = capability.handler
+        if handler is None:
             raise ValueError(f"Command '{capability.name}' is missing a handler")
-        self._commands[capability.name] = capability
+        self._commands[capability.name] = _CommandEntry(
+            capability,
+            handler,
+            inspect.iscoroutinefunction(handler),
+        )
 
     def register_many(self, capabilities: Iterable[CommandCapability]) -> None:
         for capability in capabilities:
@@ -28,16 +39,16 @@ class PluginCommandRegistry:
     def list_commands(self) -> list[CommandCapability]:
         """Return the known commands."""
 
-        return list(self._commands.values())
+        return [entry.capability for entry in self._commands.values()]
 
     async def execute(self, name: str, *args: object, **kwargs: object) -> None:
         """Execute a registered command by name."""
 
-        capability = self._commands[name]
-        handler = capability.handler
-        assert handler is not None  # mypy appeasement; register() guards this
-        result = handler(*args, **kwargs)
-        if inspect.isawaitable(result):
-            await result
-        elif isinstance(result, Awaitable):
+        entry = self._commands[name]
+        result = entry.handler(*args, **kwargs)
+        if entry.is_async:
+            await result  # type: ignore[misc]
+        # Plain callables may still hand back an awaitable (e.g. a lambda
+        # wrapping a coroutine); the None check keeps the common case cheap.
+        elif result is not None and inspect.isawaitable(result):
             await result
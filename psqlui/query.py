@@ -48,7 +48,9 @@ class AsyncpgQueryExecutor:
             if _returns_rows(statement):
                 records = await conn.fetch(statement)
                 result = _records_to_result(records)
-                status = f"{result['row_count']} row(s)" if result["row_count"] is not None else "OK"
+                status = (
+                    f"{result['row_count']} row(s)" if result["row_count"] is not None else "OK"
+                )
                 columns = result["columns"]
                 rows = result["rows"]
                 row_count = result["row_count"]
@@ -118,10 +120,8 @@ class DemoQueryExecutor:
 
 
 def _returns_rows(statement: str) -> bool:
-    token = statement.lstrip().split(None, 1)
-    if not token:
-        return False
-    head = token[0].lower()
+    # ``statement`` is already stripped and non-empty (see execute()).
+    head = statement.split(None, 1)[0].lower()
     return head in {"select", "with", "show", "values"}
 
 
@@ -132,9 +132,11 @@ def _records_to_result(records: Iterable[asyncpg.Record]) -> dict[str, object]:
         if not columns:
             keys = tuple(record.keys()) if hasattr(record, "keys") else tuple(range(len(record)))
             columns = tuple(str(key) for key in keys)
-        if not columns:
-            continue
-        rows.append(tuple(record[key] for key in columns))
+            if not columns:
+                continue
+        # Records are positional; taking values in order skips a name lookup per
+        # cell and keeps duplicate column names (SELECT 1 AS a, 2 AS a) distinct.
+        rows.append(tuple(record.values()) if hasattr(record, "values") else tuple(record))
     return {"columns": columns, "rows": tuple(rows), "row_count": len(rows)}
 
 
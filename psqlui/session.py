@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Mapping
+import inspect
+from types import MappingProxyType
+from typing import Callable, Iterator, Mapping
+import weakref
 
 from .config import AppConfig, ConnectionProfileConfig
 from .models import ConnectionProfile, MetadataSnapshot
@@ -42,6 +46,26 @@ class SessionState:
     backend_label: str = "Primary backend"
     using_fallback: bool = False
     last_error: str | None = None
+    # Distinct schemas referenced by ``metadata``; None when not precomputed.
+    schema_count: int | None = None
+    # ``schemas`` as a set for O(1) membership checks; ``schemas`` keeps the order.
+    schemas_set: frozenset[str] = frozenset()
+
+
+class _WeakListener:
+    """Session listener that does not keep its target alive."""
+
+    __slots__ = ("_ref",)
+
+    def __init__(self, listener: SessionListener, on_dead: Callable[[_WeakListener], None]) -> None:
+        # Bound methods need WeakMethod; a plain weakref to one dies immediately.
+        ref_type = weakref.WeakMethod if inspect.ismethod(listener) else weakref.ref
+        self._ref = ref_type(listener, lambda _ref: on_dead(self))
+
+    def __call__(self, state: SessionState) -> None:
+        listener = self._ref()
+        if listener is not None:
+            listener(state)
 
 
 class SessionManager:
@@ -60,8 +84,19 @@ class SessionManager:
         self._sql_intel = sql_intel
         self._config = config
         self._profiles = tuple(self._from_config(entry) for entry in config.profiles)
+        self._profile_index: dict[str, ConnectionProfile] = {}
+        for profile in self._profiles:
+            # First definition wins, matching the order users see in the sidebar.
+            self._profile_index.setdefault(profile.name, profile)
         self._listeners: set[SessionListener] = set()
+        self._listener_snapshot: tuple[SessionListener, ...] | None = None
+        self._batch_depth = 0
+        self._notify_pending = False
         self._state: SessionState | None = None
+        # Latest snapshot per profile; equal refreshes reuse it so identity checks
+        # here and in the widgets keep hitting.
+        self._metadata_by_profile: dict[str, MetadataSnapshot] = {}
+        self._pushed_metadata: Mapping[str, tuple[str, ...]] | None = None
         self._backend = backend or AsyncpgConnectionBackend()
         self._fallback_backend = fallback_backend or DemoConnectionBackend()
         self._query_executor = query_executor or AsyncpgQueryExecutor()
@@ -113,26 +148,27 @@ class SessionManager:
         event: ConnectionEvent
         backend = self._backend
         error_message: str | None = None
-        try:
-            event = backend.connect(profile)
-        except ConnectionBackendError as exc:
-            error_message = str(exc)
-            backend = self._fallback_backend
-            if backend is None:
-                raise
-            event = backend.connect(profile)
-        self._active_backends[profile.name] = backend
-        self._update_state(
-            profile,
-            event.metadata,
-            schemas=event.schemas,
-            refreshed_at=event.connected_at,
-            status=event.status,
-            latency_ms=event.latency_ms,
-            backend_label=self._label_for_backend(backend),
-            using_fallback=self._is_fallback(backend),
-            last_error=error_message,
-        )
+        with self._batched_notifications():
+            try:
+                event = backend.connect(profile)
+            except ConnectionBackendError as exc:
+                error_message = str(exc)
+                backend = self._fallback_backend
+                if backend is None:
+                    raise
+                event = backend.connect(profile)
+            self._active_backends[profile.name] = backend
+            self._update_state(
+                profile,
+                event.metadata,
+                schemas=event.schemas,
+                refreshed_at=event.connected_at,
+                status=event.status,
+                latency_ms=event.latency_ms,
+                backend_label=self._label_for_backend(backend),
+                using_fallback=self._is_fallback(backend),
+                last_error=error_message,
+            )
         return self._state
 
     def refresh_active_profile(self) -> None:
@@ -141,10 +177,11 @@ class SessionManager:
         if not self._state:
             return
         backend = self._active_backends.get(self._state.profile.name, self._backend)
-        try:
-            backend.refresh(self._state.profile)
-        except ConnectionBackendError as exc:
-            self._fallback_to_demo(self._state.profile, error_message=str(exc))
+        with self._batched_notifications():
+            try:
+                backend.refresh(self._state.profile)
+            except ConnectionBackendError as exc:
+                self._fallback_to_demo(self._state.profile, error_message=str(exc))
 
     def refresh_profile(self, name: str) -> None:
         """Refresh metadata for the requested profile, switching if needed."""
@@ -152,26 +189,45 @@ class SessionManager:
         if self._state and self._state.profile.name == name:
             self.refresh_active_profile()
             return
-        self.connect(name)
-        self.refresh_active_profile()
+        with self._batched_notifications():
+            self.connect(name)
+            self.refresh_active_profile()
+
+    def flush_notifications(self) -> None:
+        """Deliver a session update held back while a batch was in progress."""
+
+        if not self._notify_pending:
+            return
+        self._notify_pending = False
+        self._notify()
+
+    def subscribe(self, listener: SessionListener, *, weak: bool = False) -> Callable[[], None]:
+        """Subscribe to session updates; returns an unsubscribe handle.
 
-    def subscribe(self, listener: SessionListener) -> Callable[[], None]:
-        """Subscribe to session updates; returns an unsubscribe handle."""
+        With ``weak=True`` the manager only holds a weak reference, so the listener
+        (or the object owning a bound-method listener) drops out once collected.
+        """
 
-        self._listeners.add(listener)
+        entry: SessionListener = _WeakListener(listener, self._drop_listener) if weak else listener
+        self._listeners.add(entry)
+        self._listener_snapshot = None
         if self._state:
             listener(self._state)
 
         def _unsubscribe() -> None:
-            self._listeners.discard(listener)
+            self._drop_listener(entry)
 
         return _unsubscribe
 
+    def _drop_listener(self, listener: SessionListener) -> None:
+        self._listeners.discard(listener)
+        self._listener_snapshot = None
+
     def _profile_by_name(self, name: str) -> ConnectionProfile:
-        for profile in self._profiles:
-            if profile.name == name:
-                return profile
-        raise ValueError(f"Profile '{name}' not found.")
+        try:
+            return self._profile_index[name]
+        except KeyError:
+            raise ValueError(f"Profile '{name}' not found.") from None
 
     async def run_query(self, sql: str) -> QueryResult:
         """Execute SQL against the current profile."""
@@ -188,7 +244,9 @@ class SessionManager:
         except Exception as exc:  # pragma: no cover - defensive
             raise QueryExecutionError(str(exc)) from exc
 
-    def _fallback_to_demo(self, profile: ConnectionProfile, error_message: str | None = None) -> None:
+    def _fallback_to_demo(
+        self, profile: ConnectionProfile, error_message: str | None = None
+    ) -> None:
         event = self._fallback_backend.connect(profile)
         self._active_backends[profile.name] = self._fallback_backend
         self._update_state(
@@ -204,14 +262,10 @@ class SessionManager:
         )
 
     def _from_config(self, profile: ConnectionProfileConfig) -> ConnectionProfile:
-        metadata = (
-            {
-                table: tuple(columns)
-                for table, columns in (profile.metadata or {}).items()
-            }
-            if profile.metadata
-            else None
-        )
+        metadata = profile.metadata or None
+        # Config metadata is read-only; share it unless values still need tuple-ifying.
+        if metadata and not all(isinstance(columns, tuple) for columns in metadata.values()):
+            metadata = {table: tuple(columns) for table, columns in metadata.items()}
         return ConnectionProfile(
             name=profile.name,
             dsn=profile.dsn,
@@ -236,21 +290,52 @@ class SessionManager:
         using_fallback: bool | None = None,
         last_error: str | None = None,
     ) -> None:
-        self._sql_intel.update_metadata(metadata)
-        fallback_state = using_fallback if using_fallback is not None else (self._state.using_fallback if self._state else False)
+        cached = self._metadata_by_profile.get(profile.name)
+        if cached is not None and (cached is metadata or cached == metadata):
+            metadata = cached
+        else:
+            # Subscribers share this snapshot by reference; a read-only view keeps
+            # them from mutating it without paying for a defensive copy.
+            if not isinstance(metadata, MappingProxyType):
+                metadata = MappingProxyType(metadata)
+            self._metadata_by_profile[profile.name] = metadata
+        if metadata is not self._pushed_metadata:
+            self._sql_intel.update_metadata(metadata, snapshot_id=id(metadata))
+            self._pushed_metadata = metadata
+        fallback_state = (
+            using_fallback
+            if using_fallback is not None
+            else (self._state.using_fallback if self._state else False)
+        )
         if last_error is None and fallback_state and self._state:
             last_error = self._state.last_error
+        if self._state and metadata is self._state.metadata:
+            schema_count = self._state.schema_count
+            if not schemas:
+                schemas = self._state.schemas
+        else:
+            # One scan serves both the subscriber-facing count and the inferred list.
+            found = self._metadata_schemas(metadata)
+            schema_count = len(found)
+            if not schemas:
+                schemas = tuple(sorted(found)) or ("public",)
+        if self._state and (schemas is self._state.schemas or schemas == self._state.schemas):
+            schemas_set = self._state.schemas_set
+        else:
+            schemas_set = frozenset(schemas)
         self._state = SessionState(
             profile=profile,
             connected=True,
             metadata=metadata,
-            schemas=schemas or self._infer_schemas(metadata),
+            schemas=schemas,
             refreshed_at=refreshed_at or datetime.now(tz=timezone.utc),
             status=status,
             latency_ms=latency_ms,
             backend_label=backend_label or self._label_for_backend(self._backend),
             using_fallback=fallback_state,
             last_error=last_error,
+            schema_count=schema_count,
+            schemas_set=schemas_set,
         )
         self._notify()
 
@@ -286,20 +371,37 @@ class SessionManager:
         return _callback
 
     @staticmethod
-    def _infer_schemas(metadata: Mapping[str, tuple[str, ...]]) -> tuple[str, ...]:
+    def _metadata_schemas(metadata: Mapping[str, tuple[str, ...]]) -> set[str]:
         schemas: set[str] = set()
         for table in metadata:
-            if "." in table:
-                schema = table.split(".", 1)[0]
-            else:
-                schema = "public"
-            schemas.add(schema)
-        return tuple(sorted(schemas)) or ("public",)
+            schema, sep, _ = table.partition(".")
+            schemas.add(schema if sep else "public")
+        return schemas
+
+    @contextmanager
+    def _batched_notifications(self) -> Iterator[None]:
+        # Backends emit while connect/refresh is still running, so a single call
+        # can update state more than once; listeners only see the final state.
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush_notifications()
 
     def _notify(self) -> None:
         if not self._state:
             return
-        for listener in tuple(self._listeners):
+        if self._batch_depth:
+            self._notify_pending = True
+            return
+        # Listeners may (un)subscribe while we iterate, so walk an immutable snapshot;
+        # it is rebuilt only after the listener set actually changes.
+        listeners = self._listener_snapshot
+        if listeners is None:
+            listeners = self._listener_snapshot = tuple(self._listeners)
+        for listener in listeners:
             listener(self._state)
 
     def _label_for_backend(self, backend: ConnectionBackend) -> str:
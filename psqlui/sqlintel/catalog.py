@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, Sequence, Tuple
 
-from .models import Clause, Suggestion, SuggestionType
+from .models import Clause, Suggestion, SuggestionType, suggestion_sort_key
 
 
 @dataclass(slots=True)
@@ -23,26 +23,36 @@ class KeywordCatalog:
 
     def __init__(self, entries: Sequence[KeywordEntry]) -> None:
         self._entries = tuple(entries)
+        ranked = sorted(
+            ((entry, _to_suggestion(entry)) for entry in self._entries),
+            key=lambda pair: suggestion_sort_key(pair[1]),
+        )
+        self._by_clause: dict[Clause, tuple[Suggestion, ...]] = {
+            clause: tuple(suggestion for entry, suggestion in ranked if _matches(entry, clause))
+            for clause in Clause
+        }
 
     @classmethod
     def default(cls) -> "KeywordCatalog":
         return cls(_DEFAULT_ENTRIES)
 
     def suggestions_for(self, clause: Clause) -> list[Suggestion]:
-        """Return catalog entries that match the provided clause."""
-
-        matches: list[Suggestion] = []
-        for entry in self._entries:
-            if Clause.ANY in entry.clauses or clause in entry.clauses:
-                matches.append(
-                    Suggestion(
-                        label=entry.keyword,
-                        detail=entry.detail,
-                        type=SuggestionType.KEYWORD,
-                        score=entry.weight,
-                    )
-                )
-        return matches
+        """Return catalog entries that match the provided clause, best-ranked first."""
+
+        return list(self._by_clause[clause])
+
+
+def _matches(entry: KeywordEntry, clause: Clause) -> bool:
+    return Clause.ANY in entry.clauses or clause in entry.clauses
+
+
+def _to_suggestion(entry: KeywordEntry) -> Suggestion:
+    return Suggestion(
+        label=entry.keyword,
+        detail=entry.detail,
+        type=SuggestionType.KEYWORD,
+        score=entry.weight,
+    )
 
 
 _DEFAULT_ENTRIES: Tuple[KeywordEntry, ...] = (
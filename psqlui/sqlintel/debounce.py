@@ -10,28 +10,67 @@ from typing import Any
 class Debouncer:
     """Utility that coalesces rapid-fire calls into a single coroutine run."""
 
-    def __init__(self, delay: float = 0.15) -> None:
+    def __init__(self, delay: float = 0.15, *, leading: bool = False) -> None:
         self._delay = delay
+        self._leading = leading
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._timer: asyncio.TimerHandle | None = None
+        self._deadline = 0.0
+        self._pending: Callable[[], Awaitable[Any]] | None = None
         self._task: asyncio.Task[Any] | None = None
 
     def submit(self, coro_factory: Callable[[], Awaitable[Any]]) -> None:
-        """Schedule a coroutine, cancelling any pending invocation."""
+        """Schedule a coroutine, superseding any pending invocation.
+
+        With ``leading=True`` the first call of a burst runs immediately and later
+        calls within the quiet period collapse into one trailing run.
+        """
 
         if self._task:
             self._task.cancel()
-        loop = asyncio.get_running_loop()
-        self._task = loop.create_task(self._runner(coro_factory))
+            self._task = None
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            loop = self._loop = asyncio.get_running_loop()
+            self._timer = None
+        self._deadline = loop.time() + self._delay
+        if self._leading and self._timer is None:
+            self._pending = None
+            self._task = loop.create_task(self._runner(coro_factory))
+            self._timer = loop.call_later(self._delay, self._fire)
+            return
+        self._pending = coro_factory
+        # A single timer serves the whole burst; _fire re-arms itself until the
+        # quiet period since the latest submit has elapsed.
+        if self._timer is None:
+            self._timer = loop.call_later(self._delay, self._fire)
 
     def cancel(self) -> None:
         """Cancel any pending invocation."""
 
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        self._pending = None
         if self._task:
             self._task.cancel()
             self._task = None
 
+    def _fire(self) -> None:
+        loop = self._loop
+        if loop is None:  # pragma: no cover - defensive
+            return
+        remaining = self._deadline - loop.time()
+        if remaining > 0:
+            self._timer = loop.call_later(remaining, self._fire)
+            return
+        self._timer = None
+        coro_factory, self._pending = self._pending, None
+        if coro_factory is not None:
+            self._task = loop.create_task(self._runner(coro_factory))
+
     async def _runner(self, coro_factory: Callable[[], Awaitable[Any]]) -> None:
         try:
-            await asyncio.sleep(self._delay)
             await coro_factory()
         except asyncio.CancelledError:
             return
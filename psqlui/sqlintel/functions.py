@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Sequence, Tuple
 
-from .models import Clause, Suggestion, SuggestionType
+from .models import Clause, Suggestion, SuggestionType, suggestion_sort_key
 
 
 @dataclass(slots=True)
@@ -24,25 +24,35 @@ class FunctionCatalog:
 
     def __init__(self, entries: Sequence[FunctionEntry]) -> None:
         self._entries = tuple(entries)
+        ranked = sorted(
+            ((entry, _to_suggestion(entry)) for entry in self._entries),
+            key=lambda pair: suggestion_sort_key(pair[1]),
+        )
+        self._by_clause: dict[Clause, tuple[Suggestion, ...]] = {
+            clause: tuple(suggestion for entry, suggestion in ranked if _matches(entry, clause))
+            for clause in Clause
+        }
 
     @classmethod
     def default(cls) -> "FunctionCatalog":
         return cls(_DEFAULT_FUNCTIONS)
 
     def suggestions_for(self, clause: Clause) -> list[Suggestion]:
-        suggestions: list[Suggestion] = []
-        for entry in self._entries:
-            if Clause.ANY in entry.clauses or clause in entry.clauses:
-                suggestions.append(
-                    Suggestion(
-                        label=entry.name,
-                        detail=entry.signature,
-                        type=SuggestionType.FUNCTION,
-                        insert_text=f"{entry.name}()",
-                        score=entry.weight,
-                    )
-                )
-        return suggestions
+        return list(self._by_clause[clause])
+
+
+def _matches(entry: FunctionEntry, clause: Clause) -> bool:
+    return Clause.ANY in entry.clauses or clause in entry.clauses
+
+
+def _to_suggestion(entry: FunctionEntry) -> Suggestion:
+    return Suggestion(
+        label=entry.name,
+        detail=entry.signature,
+        type=SuggestionType.FUNCTION,
+        insert_text=f"{entry.name}()",
+        score=entry.weight,
+    )
 
 
 _DEFAULT_FUNCTIONS: Tuple[FunctionEntry, ...] = (
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Iterable, Mapping, Protocol, Sequence
 
-from .models import AnalysisResult, Clause, Suggestion, SuggestionType
+from .models import (
+    AnalysisResult,
+    Clause,
+    Suggestion,
+    SuggestionType,
+    normalize_identifier,
+    suggestion_sort_key,
+)
 
 
 class MetadataProvider(Protocol):
     """Protocol for services that surface identifier suggestions."""
 
     async def suggestions_for(self, analysis: AnalysisResult) -> Sequence[Suggestion]:
-        """Return identifier suggestions tailored to the given analysis result."""
+        """Return identifier suggestions tailored to the given analysis result.
+
+        Results are ideally ordered best-ranked first; the service tolerates any order.
+        """
 
 
 @dataclass(frozen=True, slots=True)
@@ -28,6 +39,7 @@ class StaticMetadataProvider:
         self._tables_full: dict[str, _TableEntry] = {}
         self._tables_short: dict[str, _TableEntry] = {}
         self._table_list: tuple[_TableEntry, ...] = ()
+        self._table_suggestions: tuple[Suggestion, ...] = ()
         self.update(tables or {})
 
     async def suggestions_for(self, analysis: AnalysisResult) -> Sequence[Suggestion]:
@@ -36,15 +48,7 @@ class StaticMetadataProvider:
             return ()
 
         if clause in {Clause.FROM, Clause.INSERT, Clause.UPDATE, Clause.DELETE}:
-            return tuple(
-                Suggestion(
-                    label=entry.label,
-                    detail="table",
-                    type=SuggestionType.IDENTIFIER,
-                    score=0.7,
-                )
-                for entry in self._table_list
-            )
+            return self._table_suggestions
 
         targets = self._targets_for_analysis(analysis)
         suggestions: list[Suggestion] = []
@@ -58,15 +62,19 @@ class StaticMetadataProvider:
                         score=0.65,
                     )
                 )
+        suggestions.sort(key=suggestion_sort_key)
         return tuple(suggestions)
 
     def _targets_for_analysis(self, analysis: AnalysisResult) -> tuple[_TableEntry, ...]:
         tables: list[_TableEntry] = []
         seen: set[_TableEntry] = set()
-        for table in analysis.tables:
-            entry = self._tables_full.get(_normalize(table))
+        keys = analysis.tables_norm or tuple(
+            normalize_identifier(table) for table in analysis.tables
+        )
+        for key in keys:
+            entry = self._tables_full.get(key)
             if not entry:
-                entry = self._tables_short.get(_normalize(table.split(".")[-1]))
+                entry = self._tables_short.get(key.rpartition(".")[2])
             if entry and entry not in seen:
                 tables.append(entry)
                 seen.add(entry)
@@ -81,15 +89,19 @@ class StaticMetadataProvider:
         self._tables_short.clear()
         for table_name, columns in tables.items():
             entry = _TableEntry(label=table_name, columns=tuple(columns))
-            self._tables_full[_normalize(table_name)] = entry
-            short = table_name.split(".")[-1]
-            short_key = _normalize(short)
-            self._tables_short.setdefault(short_key, entry)
+            key = sys.intern(normalize_identifier(table_name))
+            self._tables_full[key] = entry
+            self._tables_short.setdefault(sys.intern(key.rpartition(".")[2]), entry)
         self._table_list = tuple(self._tables_full.values()) or tuple(self._tables_short.values())
-
-
-def _normalize(value: str) -> str:
-    return value.replace('"', "").lower()
+        self._table_suggestions = tuple(
+            Suggestion(
+                label=entry.label,
+                detail="table",
+                type=SuggestionType.IDENTIFIER,
+                score=0.7,
+            )
+            for entry in sorted(self._table_list, key=lambda entry: entry.label)
+        )
 
 
 __all__ = ["MetadataProvider", "StaticMetadataProvider"]
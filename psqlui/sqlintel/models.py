@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple
+from typing import NamedTuple, Tuple
 
 from sqlglot import exp
 
@@ -49,9 +49,8 @@ class LintMode(str, Enum):
     EXECUTION = "execution"
 
 
-@dataclass(slots=True)
-class Suggestion:
-    """Single autocomplete entry."""
+class Suggestion(NamedTuple):
+    """Single autocomplete entry (immutable so catalogs can share instances)."""
 
     label: str
     type: SuggestionType
@@ -60,6 +59,18 @@ class Suggestion:
     score: float = 0.0
 
 
+def suggestion_sort_key(suggestion: Suggestion) -> tuple[float, str]:
+    """Ranking key shared by catalogs and the service (highest score first, then label)."""
+
+    return (-suggestion.score, suggestion.label)
+
+
+def normalize_identifier(value: str) -> str:
+    """Case/quote-insensitive key used to match identifiers against metadata."""
+
+    return value.replace('"', "").lower()
+
+
 @dataclass(slots=True)
 class Diagnostic:
     """Represents an issue discovered while linting."""
@@ -81,6 +92,7 @@ class AnalysisResult:
     columns: Tuple[str, ...]
     ast: exp.Expression | None
     errors: Tuple[str, ...]
+    tables_norm: Tuple[str, ...] = ()
 
 
 __all__ = [
@@ -91,4 +103,6 @@ __all__ = [
     "LintMode",
     "Suggestion",
     "SuggestionType",
+    "normalize_identifier",
+    "suggestion_sort_key",
 ]
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import heapq
 import re
+from dataclasses import dataclass
+from itertools import islice
 from typing import Iterable, Mapping, Sequence
 
-from sqlglot import exp, parse_one
-from sqlglot.errors import ParseError
+from sqlglot import exp
+from sqlglot.dialects.dialect import Dialect
+from sqlglot.errors import ParseError, TokenError
+from sqlglot.tokens import Token, TokenType
 
 from .catalog import KeywordCatalog
 from .functions import FunctionCatalog
@@ -18,12 +23,30 @@ from .models import (
     DiagnosticSeverity,
     LintMode,
     Suggestion,
+    normalize_identifier,
+    suggestion_sort_key,
 )
 from .snippets import SnippetCatalog
 
 MAX_SUGGESTIONS = 50
 
 
+@dataclass(frozen=True, slots=True)
+class _ParsedStatement:
+    """Cursor-independent parse output for one stripped statement."""
+
+    sql: str
+    tokens: list[Token] | None = None
+    ast: exp.Expression | None = None
+    tables: tuple[str, ...] = ()
+    tables_norm: tuple[str, ...] = ()
+    columns: tuple[str, ...] = ()
+    errors: tuple[str, ...] = ()
+
+
+_EMPTY_STATEMENT = _ParsedStatement(sql="")
+
+
 class SqlIntelService:
     """Facade that wraps sqlglot parsing and feeds the editor with hints."""
 
@@ -41,6 +64,9 @@ class SqlIntelService:
         self._functions = function_catalog or FunctionCatalog.default()
         self._snippets = snippet_catalog or SnippetCatalog.default()
         self._dialect = dialect
+        self._sqlglot_dialect = Dialect.get_or_raise(dialect)
+        self._last_parsed: _ParsedStatement | None = None
+        self._metadata_snapshot_id: int | None = None
 
     async def prime(self) -> None:
         """Placeholder for future warm-up hooks."""
@@ -50,31 +76,69 @@ class SqlIntelService:
     async def analyze(self, buffer: str, cursor: int) -> AnalysisResult:
         """Parse the buffer and derive structural context."""
 
-        clause = _detect_clause(buffer, cursor)
         stripped = buffer.strip()
-        ast: exp.Expression | None = None
-        errors: list[str] = []
-        tables: tuple[str, ...] = ()
-        columns: tuple[str, ...] = ()
+        clause = Clause.ANY
+        parsed = _EMPTY_STATEMENT
         if stripped:
-            try:
-                ast = parse_one(stripped, read=self._dialect)
-            except ParseError as exc:
-                errors.append(str(exc).strip())
+            parsed = self._parse_statement(stripped)
+            if parsed.tokens is None:
+                clause = _detect_clause(buffer, cursor)
             else:
-                tables = tuple(_collect_tables(ast))
-                columns = tuple(_collect_columns(ast))
+                offset = len(buffer) - len(buffer.lstrip())
+                clause = _clause_from_tokens(parsed.tokens, cursor - offset)
 
         return AnalysisResult(
             buffer=buffer,
             cursor=cursor,
             clause=clause,
-            tables=tables,
-            columns=columns,
-            ast=ast,
-            errors=tuple(errors),
+            tables=parsed.tables,
+            columns=parsed.columns,
+            ast=parsed.ast,
+            errors=parsed.errors,
+            tables_norm=parsed.tables_norm,
         )
 
+    def _parse_statement(self, stripped: str) -> _ParsedStatement:
+        """Tokenize + parse a stripped statement, reusing the previous result if unchanged.
+
+        Cursor moves and whitespace-only edits leave the stripped text intact, so the
+        common editor transitions skip sqlglot entirely.
+        """
+
+        cached = self._last_parsed
+        if cached is not None and cached.sql == stripped:
+            return cached
+        # Lex once: the same token stream drives clause detection and the parser.
+        try:
+            tokens = self._sqlglot_dialect.tokenize(stripped)
+        except TokenError as exc:
+            parsed = _ParsedStatement(sql=stripped, errors=(str(exc).strip(),))
+        else:
+            try:
+                ast = self._parse_tokens(tokens, stripped)
+            except ParseError as exc:
+                parsed = _ParsedStatement(sql=stripped, tokens=tokens, errors=(str(exc).strip(),))
+            else:
+                tables, tables_norm = _collect_tables(ast)
+                parsed = _ParsedStatement(
+                    sql=stripped,
+                    tokens=tokens,
+                    ast=ast,
+                    tables=tables,
+                    tables_norm=tables_norm,
+                    columns=tuple(_collect_columns(ast)),
+                )
+        self._last_parsed = parsed
+        return parsed
+
+    def _parse_tokens(self, tokens: list[Token], sql: str) -> exp.Expression:
+        """Mirror ``sqlglot.parse_one`` on an already tokenized statement."""
+
+        expressions = self._sqlglot_dialect.parser().parse(tokens, sql)
+        if not expressions or expressions[0] is None:
+            raise ParseError(f"No expression was parsed from '{sql}'")
+        return expressions[0]
+
     async def suggest(self, buffer: str, cursor: int) -> list[Suggestion]:
         """Return ordered suggestions for the current cursor location."""
 
@@ -84,17 +148,31 @@ class SqlIntelService:
     async def suggestions_from_analysis(self, analysis: AnalysisResult) -> list[Suggestion]:
         """Return suggestions using a precomputed analysis result."""
 
-        suggestions = self._keywords.suggestions_for(analysis.clause)
-        suggestions.extend(self._snippets.suggestions_for(analysis))
-        suggestions.extend(self._functions.suggestions_for(analysis.clause))
-        suggestions.extend(await self._metadata.suggestions_for(analysis))
-        suggestions.sort(key=lambda item: (-item.score, item.label))
-        return suggestions[:MAX_SUGGESTIONS]
+        # Catalog streams arrive pre-ranked; only the (unordered by contract) metadata
+        # stream needs ranking, and only its top MAX_SUGGESTIONS can ever surface.
+        identifiers = await self._metadata.suggestions_for(analysis)
+        merged = heapq.merge(
+            self._keywords.suggestions_for(analysis.clause),
+            self._snippets.suggestions_for(analysis),
+            self._functions.suggestions_for(analysis.clause),
+            heapq.nsmallest(MAX_SUGGESTIONS, identifiers, key=suggestion_sort_key),
+            key=suggestion_sort_key,
+        )
+        return list(islice(merged, MAX_SUGGESTIONS))
 
     async def lint(self, statement: str, mode: LintMode = LintMode.INTERACTIVE) -> list[Diagnostic]:
         """Run lightweight lint rules on the provided statement."""
 
         analysis = await self.analyze(statement, len(statement))
+        return await self.lint_from_analysis(analysis, mode)
+
+    async def lint_from_analysis(
+        self,
+        analysis: AnalysisResult,
+        mode: LintMode = LintMode.INTERACTIVE,
+    ) -> list[Diagnostic]:
+        """Run lint rules against a precomputed analysis result."""
+
         diagnostics: list[Diagnostic] = []
         for error in analysis.errors:
             diagnostics.append(Diagnostic(message=error, severity=DiagnosticSeverity.ERROR))
@@ -141,18 +219,29 @@ class SqlIntelService:
             )
         return diagnostics
 
-    def update_metadata(self, tables: Mapping[str, Sequence[str]]) -> None:
-        """Replace underlying metadata if the provider supports it."""
+    def update_metadata(
+        self, tables: Mapping[str, Sequence[str]], *, snapshot_id: int | None = None
+    ) -> None:
+        """Replace underlying metadata if the provider supports it.
+
+        ``snapshot_id`` identifies an immutable snapshot (the session passes its
+        ``id()`` while keeping it alive); repeating the last id skips the rebuild.
+        """
 
+        if snapshot_id is not None and snapshot_id == self._metadata_snapshot_id:
+            return
+        self._metadata_snapshot_id = snapshot_id
         updater = getattr(self._metadata, "update", None)
         if callable(updater):
             updater(tables)
 
 
+# "DELETE FROM"/"INSERT INTO" are deliberately absent: they start where DELETE/INSERT
+# do, and as alternation branches they would swallow the trailing FROM/INTO keyword.
 _CLAUSE_TOKENS: dict[Clause, tuple[str, ...]] = {
-    Clause.DELETE: ("DELETE FROM", "DELETE"),
+    Clause.DELETE: ("DELETE",),
     Clause.UPDATE: ("UPDATE",),
-    Clause.INSERT: ("INSERT INTO", "INSERT"),
+    Clause.INSERT: ("INSERT",),
     Clause.SELECT: ("SELECT",),
     Clause.FROM: ("FROM",),
     Clause.WHERE: ("WHERE",),
@@ -163,49 +252,90 @@ _CLAUSE_TOKENS: dict[Clause, tuple[str, ...]] = {
 }
 
 
+_CLAUSE_BY_KEYWORD: dict[str, Clause] = {
+    token: clause for clause, tokens in _CLAUSE_TOKENS.items() for token in tokens
+}
+
+# Longest keywords first so multi-word branches win the alternation.
+_CLAUSE_RE = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(token) for token in sorted(_CLAUSE_BY_KEYWORD, key=len, reverse=True))
+    + r")\b"
+)
+
+
+_CLAUSE_TOKEN_TYPES: dict[TokenType, Clause] = {
+    TokenType.DELETE: Clause.DELETE,
+    TokenType.UPDATE: Clause.UPDATE,
+    TokenType.INSERT: Clause.INSERT,
+    TokenType.SELECT: Clause.SELECT,
+    TokenType.FROM: Clause.FROM,
+    TokenType.WHERE: Clause.WHERE,
+    TokenType.GROUP_BY: Clause.GROUP,
+    TokenType.HAVING: Clause.HAVING,
+    TokenType.ORDER_BY: Clause.ORDER,
+    TokenType.LIMIT: Clause.LIMIT,
+}
+
+
+def _clause_from_tokens(tokens: Sequence[Token], cursor: int) -> Clause:
+    """Return the clause introduced by the last keyword that ends before the cursor."""
+
+    clause = Clause.ANY
+    for token in tokens:
+        if token.end >= cursor:
+            break
+        clause = _CLAUSE_TOKEN_TYPES.get(token.token_type, clause)
+    return clause
+
+
 def _detect_clause(buffer: str, cursor: int) -> Clause:
+    """Regex fallback for buffers the tokenizer rejects (e.g. unterminated quotes)."""
+
     search = buffer[:cursor].upper()
-    if not search.strip():
+    last_keyword: str | None = None
+    for match in _CLAUSE_RE.finditer(search):
+        last_keyword = match.group()
+    if last_keyword is None:
         return Clause.ANY
-    last_clause = Clause.ANY
-    last_pos = -1
-    for clause, tokens in _CLAUSE_TOKENS.items():
-        for token in tokens:
-            pos = _rfind_token(search, token)
-            if pos > last_pos:
-                last_pos = pos
-                last_clause = clause
-    return last_clause if last_pos >= 0 else Clause.ANY
-
-
-def _rfind_token(haystack: str, needle: str) -> int:
-    pattern = re.compile(rf"\b{re.escape(needle)}\b")
-    match_pos = -1
-    for match in pattern.finditer(haystack):
-        match_pos = match.start()
-    return match_pos
-
-
-def _collect_tables(expression: exp.Expression) -> Iterable[str]:
+    return _CLAUSE_BY_KEYWORD[last_keyword]
+
+
+def _collect_tables(expression: exp.Expression) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return unique table labels plus their normalized lookup keys."""
+
     tables: list[str] = []
+    keys: list[str] = []
+    seen_raw: set[tuple[str, str]] = set()
     seen: set[str] = set()
     for table in expression.find_all(exp.Table):
-        schema = table.db
-        name = table.name or ""
+        # Repeated references share the raw (schema, name) pair, so only the first
+        # sighting pays for building and normalizing a label.
+        raw = (table.db, table.name or "")
+        if raw in seen_raw:
+            continue
+        seen_raw.add(raw)
+        schema, name = raw
         label = f"{schema}.{name}" if schema else name
-        norm = label.lower()
+        norm = normalize_identifier(label)
         if norm and norm not in seen:
             tables.append(label)
+            keys.append(norm)
             seen.add(norm)
-    return tables
+    return tuple(tables), tuple(keys)
 
 
 def _collect_columns(expression: exp.Expression) -> Iterable[str]:
     columns: list[str] = []
+    seen_raw: set[tuple[str, str]] = set()
     seen: set[str] = set()
     for column in expression.find_all(exp.Column):
-        qualifier = column.table
-        label = f"{qualifier}.{column.name}" if qualifier else column.name
+        raw = (column.table, column.name)
+        if raw in seen_raw:
+            continue
+        seen_raw.add(raw)
+        qualifier, name = raw
+        label = f"{qualifier}.{name}" if qualifier else name
         norm = label.lower()
         if norm and norm not in seen:
             columns.append(label)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from string import Formatter
 from typing import Sequence, Tuple
 
 from .models import AnalysisResult, Clause, Suggestion, SuggestionType
@@ -15,12 +16,44 @@ class SnippetEntry:
     label: str
     template: str
     detail: str
-    clauses: Tuple[Clause, ...]
+    clauses: frozenset[Clause]
     weight: float = 0.55
+    _is_any: bool = field(default=False, init=False, repr=False, compare=False)
+    _affixes: tuple[str, str] | None = field(default=None, init=False, repr=False, compare=False)
+    _last_render: tuple[str, Suggestion] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _empty_suggestion: Suggestion | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of clauses but store a frozenset for O(1) membership.
+        self.clauses = frozenset(self.clauses)
+        self._is_any = Clause.ANY in self.clauses
+        self._affixes = _split_table_template(self.template)
 
     def render(self, analysis: AnalysisResult) -> Suggestion:
-        table = analysis.tables[0] if analysis.tables else "table_name"
-        insert_text = self.template.format(table=table)
+        if not analysis.tables:
+            # Without table context every render is identical; build it once.
+            if self._empty_suggestion is None:
+                self._empty_suggestion = self._build("table_name")
+            return self._empty_suggestion
+        table = analysis.tables[0]
+        # Consecutive keystrokes usually target the same table; Suggestion is immutable.
+        cached = self._last_render
+        if cached is not None and cached[0] == table:
+            return cached[1]
+        suggestion = self._build(table)
+        self._last_render = (table, suggestion)
+        return suggestion
+
+    def _build(self, table: str) -> Suggestion:
+        if self._affixes is not None:
+            prefix, suffix = self._affixes
+            insert_text = prefix + table + suffix
+        else:
+            insert_text = self.template.format(table=table)
         return Suggestion(
             label=self.label,
             detail=self.detail,
@@ -30,23 +63,50 @@ class SnippetEntry:
         )
 
 
+def _split_table_template(template: str) -> tuple[str, str] | None:
+    """Split a template with a single bare ``{table}`` field into (prefix, suffix).
+
+    Returns ``None`` for anything fancier so ``render`` falls back to ``str.format``.
+    """
+
+    prefix: list[str] = []
+    suffix: list[str] = []
+    seen_field = False
+    try:
+        parts = list(Formatter().parse(template))
+    except ValueError:
+        return None
+    for literal, field_name, format_spec, conversion in parts:
+        (suffix if seen_field else prefix).append(literal)
+        if field_name is None:
+            continue
+        if seen_field or field_name != "table" or format_spec or conversion:
+            return None
+        seen_field = True
+    if not seen_field:
+        return None
+    return "".join(prefix), "".join(suffix)
+
+
 class SnippetCatalog:
     """Return snippet suggestions using the current analysis context."""
 
     def __init__(self, entries: Sequence[SnippetEntry]) -> None:
-        self._entries = tuple(entries)
+        # Rendering never changes score or label, so entry order is also rank order.
+        self._entries = tuple(sorted(entries, key=lambda entry: (-entry.weight, entry.label)))
+        self._by_clause: dict[Clause, tuple[SnippetEntry, ...]] = {
+            clause: tuple(
+                entry for entry in self._entries if entry._is_any or clause in entry.clauses
+            )
+            for clause in Clause
+        }
 
     @classmethod
     def default(cls) -> "SnippetCatalog":
         return cls(_DEFAULT_SNIPPETS)
 
     def suggestions_for(self, analysis: AnalysisResult) -> list[Suggestion]:
-        clause = analysis.clause
-        suggestions: list[Suggestion] = []
-        for entry in self._entries:
-            if Clause.ANY in entry.clauses or clause in entry.clauses:
-                suggestions.append(entry.render(analysis))
-        return suggestions
+        return [entry.render(analysis) for entry in self._by_clause[analysis.clause]]
 
 
 _DEFAULT_SNIPPETS: Tuple[SnippetEntry, ...] = (
@@ -54,13 +114,13 @@ _DEFAULT_SNIPPETS: Tuple[SnippetEntry, ...] = (
         label="Limit 100 rows",
         template="SELECT * FROM {table} LIMIT 100;",
         detail="Quick peek at a table with sane row cap",
-        clauses=(Clause.SELECT, Clause.FROM, Clause.ANY),
+        clauses=frozenset({Clause.SELECT, Clause.FROM, Clause.ANY}),
     ),
     SnippetEntry(
         label="Exists guard",
         template="WHERE EXISTS (SELECT 1 FROM {table} WHERE /* condition */)",
         detail="Filter rows when a related record exists",
-        clauses=(Clause.WHERE,),
+        clauses=frozenset({Clause.WHERE}),
     ),
     SnippetEntry(
         label="Upsert skeleton",
@@ -69,7 +129,7 @@ _DEFAULT_SNIPPETS: Tuple[SnippetEntry, ...] = (
             "ON CONFLICT (id) DO UPDATE SET column = EXCLUDED.column;"
         ),
         detail="Ready-to-edit INSERT ... ON CONFLICT block",
-        clauses=(Clause.INSERT,),
+        clauses=frozenset({Clause.INSERT}),
     ),
 )
 
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import heapq
+from collections.abc import Mapping
 from typing import Callable
 
 from textual import events, on
@@ -10,10 +11,18 @@ from textual.app import ComposeResult
 from textual.containers import Container
 from textual.binding import Binding
 from textual.message import Message
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Button, Label, ListItem, ListView, Static
 
-from psqlui.session import SessionManager, SessionState
+from psqlui.session import ConnectionProfile, SessionManager, SessionState
+
+_SCHEMA_PREVIEW_LIMIT = 5
+_RENDER_DELAY = 0.016  # roughly one frame at 60Hz
+_EMPTY_SCHEMAS = "No schemas loaded."
+_SUMMARY_TEMPLATE = (
+    "Profile: %s\nHost: %s\nDatabase: %s\nSchemas: %d · Tables: %d\nStatus: %s (%s)\nBackend: %s"
+)
 
 
 class NavigationSidebar(Container):
@@ -67,15 +76,34 @@ class NavigationSidebar(Container):
         self._session_manager = session_manager
         self._profile_list: ListView | None = None
         self._profile_items: dict[str, _ProfileListItem] = {}
+        self._profile_positions: dict[str, int] = {}
+        self._active_profile: str | None = None
+        self._rendered_profiles: tuple[ConnectionProfile, ...] | None = None
         self._schemas: Static | None = None
+        self._schema_metadata: Mapping[str, tuple[str, ...]] | None = None
+        self._schema_fingerprint: tuple[frozenset[str], tuple[str, ...]] | None = None
+        self._last_schema_text: str | None = None
+        self._last_summary: str | None = None
         self._profile_summary: Static | None = None
         self._context_menu: _ProfileContextMenu | None = None
         self._unsubscribe: Callable[[], None] | None = None
+        self._pending_state: SessionState | None = None
+        self._flush_timer: Timer | None = None
+        self._switcher: Callable[[str], None] | None = None
+        self._width_reporter: Callable[[int], None] | None = None
 
     def compose(self) -> ComposeResult:
         yield Static("Connections", classes="sidebar-heading")
-        items = [_ProfileListItem(profile.name) for profile in self._session_manager.profiles]
-        self._profile_items = {item.profile_name: item for item in items}
+        items: list[_ProfileListItem] = []
+        self._profile_items = {}
+        self._profile_positions = {}
+        for profile in self._session_manager.profiles:
+            item = _ProfileListItem(profile.name)
+            self._profile_positions[profile.name] = len(items)
+            self._profile_items[profile.name] = item
+            items.append(item)
+        self._active_profile = None
+        self._rendered_profiles = None
         self._profile_list = _ProfileListView(*items, id="profile-list")
         yield self._profile_list
         yield Static("Press m or Shift+F10 for actions", classes="sidebar-hint")
@@ -84,21 +112,43 @@ class NavigationSidebar(Container):
         self._profile_summary = Static("", id="profile-summary", classes="sidebar-section")
         yield self._profile_summary
         yield Static("Schemas", classes="sidebar-heading")
-        self._schemas = Static("No schemas loaded.", id="schema-list", classes="sidebar-section")
+        self._schemas = Static(_EMPTY_SCHEMAS, id="schema-list", classes="sidebar-section")
+        self._last_schema_text = _EMPTY_SCHEMAS
         yield self._schemas
 
     async def on_mount(self) -> None:
+        # The app outlives this widget, so resolve its optional hooks once.
+        app = self.app
+        self._switcher = getattr(app, "switch_profile", None)
+        self._width_reporter = getattr(app, "remember_sidebar_width", None)
         self._unsubscribe = self._session_manager.subscribe(self._handle_session_update)
 
     def on_unmount(self) -> None:
         if self._unsubscribe:
             self._unsubscribe()
             self._unsubscribe = None
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self._pending_state = None
+        self._switcher = None
+        self._width_reporter = None
 
     async def on_resize(self, event: events.Resize) -> None:
         self._report_width(event.size.width)
 
     def _handle_session_update(self, state: SessionState) -> None:
+        # Bursts of updates (metadata streaming in, latency probes) collapse into
+        # a single render of the latest state.
+        self._pending_state = state
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(_RENDER_DELAY, self._flush_session_update)
+
+    def _flush_session_update(self) -> None:
+        self._flush_timer = None
+        state, self._pending_state = self._pending_state, None
+        if state is None:
+            return
         self._render_connections(state)
         self._render_schemas(state)
         self._render_profile_summary(state)
@@ -106,43 +156,75 @@ class NavigationSidebar(Container):
     def _render_connections(self, state: SessionState) -> None:
         if not self._profile_list:
             return
-        profiles = list(self._session_manager.profiles)
-        active_index = 0
-        for idx, profile in enumerate(profiles):
-            item = self._profile_items.get(profile.name)
-            if item is None:
-                continue
-            item.set_class(profile.name == state.profile.name, "active")
-            if profile.name == state.profile.name:
-                active_index = idx
-        if profiles:
-            self._profile_list.index = active_index
+        active = state.profile.name
+        profiles = self._session_manager.profiles
+        if active == self._active_profile and profiles is self._rendered_profiles:
+            # Status/metadata ticks leave the list untouched.
+            return
+        # Only the outgoing and incoming rows change class.
+        previous = self._profile_items.get(self._active_profile or "")
+        if previous is not None:
+            previous.set_class(False, "active")
+        current = self._profile_items.get(active)
+        if current is not None:
+            current.set_class(True, "active")
+        self._active_profile = active
+        self._rendered_profiles = profiles
+        if self._profile_positions:
+            self._profile_list.index = self._profile_positions.get(active, 0)
 
     def _render_schemas(self, state: SessionState) -> None:
         if not self._schemas:
             return
         metadata = state.metadata
-        buckets: dict[str, list[str]] = defaultdict(list)
-        for table in sorted(metadata):
-            if "." in table:
-                schema, rel = table.split(".", 1)
-            else:
+        if not metadata and not state.schemas:
+            # Common before a connection is established; nothing to bucket.
+            self._schema_fingerprint = None
+            self._set_schema_text(_EMPTY_SCHEMAS)
+            return
+        # Snapshots are immutable and the session reuses them across status/latency
+        # ticks, so identity settles most updates without hashing table names.
+        if metadata is self._schema_metadata and self._schema_fingerprint is not None:
+            if state.schemas == self._schema_fingerprint[1]:
+                return
+        self._schema_metadata = metadata
+        # Otherwise the rendered list depends only on table names + schemas.
+        fingerprint = (frozenset(metadata), state.schemas)
+        if fingerprint == self._schema_fingerprint:
+            return
+        self._schema_fingerprint = fingerprint
+        # One unsorted pass; ordering is only needed for the few rows shown per schema.
+        buckets: dict[str, list[tuple[str, str]]] = {}
+        bucket_for = buckets.get
+        for table in metadata:
+            schema, sep, rel = table.partition(".")
+            if not sep:
                 schema, rel = "public", table
-            buckets[schema].append(rel)
+            entries = bucket_for(schema)
+            if entries is None:
+                entries = buckets[schema] = []
+            entries.append((table, rel))
         schemas = state.schemas or tuple(sorted(buckets))
         if not schemas:
-            self._schemas.update("No schemas loaded.")
+            self._set_schema_text(_EMPTY_SCHEMAS)
             return
         lines: list[str] = []
         for schema in schemas:
             lines.append(schema)
-            tables = buckets.get(schema, [])
-            if not tables:
+            entries = buckets.get(schema)
+            if not entries:
                 lines.append("  - No tables yet")
                 continue
-            for rel in tables[:5]:
-                lines.append(f"  - {rel}")
-        self._schemas.update("\n".join(lines))
+            # Ranked by the full table key, matching a global sort of the metadata.
+            preview = heapq.nsmallest(_SCHEMA_PREVIEW_LIMIT, entries)
+            lines.extend(f"  - {rel}" for _, rel in preview)
+        self._set_schema_text("\n".join(lines))
+
+    def _set_schema_text(self, text: str) -> None:
+        if self._schemas is None or text == self._last_schema_text:
+            return
+        self._last_schema_text = text
+        self._schemas.update(text)
 
     @on(ListView.Selected)
     def _handle_profile_selected(self, event: ListView.Selected) -> None:
@@ -155,10 +237,8 @@ class NavigationSidebar(Container):
             event.stop()
 
     def _request_switch(self, name: str) -> None:
-        switcher = getattr(self.app, "switch_profile", None)
-        if switcher is None:
-            return
-        switcher(name)
+        if self._switcher is not None:
+            self._switcher(name)
 
     def _render_profile_summary(self, state: SessionState) -> None:
         if not self._profile_summary:
@@ -168,26 +248,30 @@ class NavigationSidebar(Container):
         latency = f"{state.latency_ms} ms" if state.latency_ms is not None else "—"
         schema_count = len(state.schemas or ())
         table_count = len(state.metadata)
-        backend = state.backend_label or ("Demo fallback" if state.using_fallback else "Primary backend")
-        lines = [
-            f"Profile: {state.profile.name}",
-            f"Host: {host}",
-            f"Database: {database}",
-            f"Schemas: {schema_count} · Tables: {table_count}",
-            f"Status: {state.status} ({latency})",
-            f"Backend: {backend}",
-        ]
+        backend = state.backend_label or (
+            "Demo fallback" if state.using_fallback else "Primary backend"
+        )
+        summary = _SUMMARY_TEMPLATE % (
+            state.profile.name,
+            host,
+            database,
+            schema_count,
+            table_count,
+            state.status,
+            latency,
+            backend,
+        )
         if state.using_fallback and state.last_error:
             reason = state.last_error.splitlines()[0][:120]
-            lines.append(f"Fallback reason: {reason}")
-        self._profile_summary.update("\n".join(lines))
+            summary += f"\nFallback reason: {reason}"
+        if summary == self._last_summary:
+            return
+        self._last_summary = summary
+        self._profile_summary.update(summary)
 
     def _report_width(self, width: int) -> None:
-        remember = getattr(self.app, "remember_sidebar_width", None)
-        if remember is None:
-            return
-        if width > 0:
-            remember(width)
+        if self._width_reporter is not None and width > 0:
+            self._width_reporter(width)
 
     def _handle_profile_action(self, action: str, profile_name: str) -> None:
         if action == "switch":
@@ -290,8 +374,12 @@ class _ProfileContextMenu(Container):
         self._on_action = action_handler
         self._profile_name: str | None = None
         self._title = Label("", classes="context-title")
-        self._switch_button = Button("Activate profile", id="context-switch", flat=True, compact=True)
-        self._refresh_button = Button("Refresh metadata", id="context-refresh", flat=True, compact=True)
+        self._switch_button = Button(
+            "Activate profile", id="context-switch", flat=True, compact=True
+        )
+        self._refresh_button = Button(
+            "Refresh metadata", id="context-refresh", flat=True, compact=True
+        )
         self._buttons: tuple[Button, Button] = (self._switch_button, self._refresh_button)
         self._focused_index = 0
         self.display = False
@@ -380,6 +468,8 @@ class _ProfileContextMenu(Container):
 class _ProfileContextRequested(Message):
     """Message emitted when a list item is right-clicked."""
 
+    __slots__ = ("profile_name",)
+
     def __init__(self, profile_name: str) -> None:
         super().__init__()
         self.profile_name = profile_name
@@ -16,6 +16,10 @@ from psqlui.sqlintel import AnalysisResult, SqlIntelService, Suggestion
 from psqlui.sqlintel.debounce import Debouncer
 from psqlui.session import SessionManager, SessionState
 
+_SUGGESTIONS_PLACEHOLDER = "Suggestions appear here."
+_SUGGESTION_ROWS = 5
+_TRIGGER_KEYS = frozenset({"ctrl+enter", "ctrl+j", "newline"})
+
 
 class QueryPad(Container):
     """Minimal editor surface used to validate the SqlIntelService round-trip."""
@@ -82,17 +86,24 @@ class QueryPad(Container):
     ) -> None:
         super().__init__(id="query-pad")
         self._sql_service = sql_service
-        self._debouncer = Debouncer()
+        self._debouncer = Debouncer(leading=True)
         self._suggestions: Static | None = None
         self._analysis_panel: Static | None = None
         self._metadata_panel: Static | None = None
         self._status_panel: Static | None = None
         self._input: Input | None = None
         self._result_table: DataTable | None = None
-        self._metadata_snapshot: Mapping[str, Sequence[str]] = dict(initial_metadata or {})
+        self._metadata_snapshot: Mapping[str, Sequence[str]] = initial_metadata or {}
+        self._metadata_rendered: Mapping[str, Sequence[str]] | None = None
         self._session_manager = session_manager
         self._unsubscribe: Callable[[], None] | None = None
         self._result_limit = 200
+        self._analysis_seq = 0
+        self._last_analysis_key: tuple[object, ...] | None = None
+        self._last_submitted = ""
+        self._pending_render: dict[Static, str] = {}
+        self._rendered_text: dict[Static, str] = {}
+        self._flush_scheduled = False
 
     def compose(self) -> ComposeResult:
         """Compose the input + suggestion panes."""
@@ -103,7 +114,7 @@ class QueryPad(Container):
             id="query-input",
             on_query=self._request_query_run,
         )
-        yield Static("Suggestions appear here.", id="query-suggestions")
+        yield Static(_SUGGESTIONS_PLACEHOLDER, id="query-suggestions")
         yield Static("", id="query-analysis")
         yield Static("", id="metadata-status")
         actions = Horizontal(
@@ -134,8 +145,18 @@ class QueryPad(Container):
 
     async def on_input_changed(self, event: Input.Changed) -> None:
         buffer = event.value
+        if buffer == self._last_submitted:
+            # Focus/selection churn re-emits Changed; the queued or finished run covers it.
+            return
+        self._last_submitted = buffer
+        self._analysis_seq += 1
+        if not buffer.strip():
+            self._debouncer.cancel()
+            self._render_empty()
+            return
         cursor = len(buffer)
-        self._debouncer.submit(lambda b=buffer, c=cursor: self._refresh_analysis(b, c))
+        seq = self._analysis_seq
+        self._debouncer.submit(lambda b=buffer, c=cursor, s=seq: self._refresh_analysis(b, c, s))
 
     async def action_run_query(self) -> None:
         await self._execute_current_query()
@@ -165,27 +186,47 @@ class QueryPad(Container):
         badge = f"{result.status} · {result.elapsed_ms} ms"
         self._set_status(badge, severity="success")
 
-    async def _refresh_analysis(self, buffer: str, cursor: int) -> None:
+    async def _refresh_analysis(self, buffer: str, cursor: int, seq: int) -> None:
+        # A newer keystroke supersedes this run; drop results instead of rendering them.
         analysis = await self._sql_service.analyze(buffer, cursor)
-        suggestions = await self._sql_service.suggestions_from_analysis(analysis)
+        if seq != self._analysis_seq:
+            return
+        # Paint clause/tables right away; suggestions follow once ranked.
         self._render_analysis(analysis)
+        suggestions = await self._sql_service.suggestions_from_analysis(analysis)
+        if seq != self._analysis_seq:
+            return
         self._render_suggestions(suggestions)
 
+    def _render_empty(self) -> None:
+        if self._suggestions:
+            self._queue_update(self._suggestions, _SUGGESTIONS_PLACEHOLDER)
+        if self._analysis_panel:
+            self._last_analysis_key = None
+            self._queue_update(self._analysis_panel, "")
+
     def _render_suggestions(self, suggestions: list[Suggestion]) -> None:
         if not self._suggestions:
             return
         if not suggestions:
-            self._suggestions.update("No suggestions yet.")
+            self._queue_update(self._suggestions, "No suggestions yet.")
             return
         rows = [
-            f"{entry.label} · {entry.detail or entry.type.value}"
-            for entry in suggestions[:5]
+            f"{entry.label} · {entry.detail}"
+            if entry.detail
+            else f"{entry.label} · {entry.type.value}"
+            for entry in suggestions[:_SUGGESTION_ROWS]
         ]
-        self._suggestions.update("\n".join(rows))
+        self._queue_update(self._suggestions, "\n".join(rows))
 
     def _render_analysis(self, analysis: AnalysisResult) -> None:
         if not self._analysis_panel:
             return
+        # Consecutive keystrokes inside an identifier usually yield the same summary.
+        key = (analysis.clause, analysis.tables, analysis.columns, analysis.errors[:1])
+        if key == self._last_analysis_key:
+            return
+        self._last_analysis_key = key
         lines = [
             f"Clause: {analysis.clause.value}",
             f"Tables: {', '.join(analysis.tables) if analysis.tables else '—'}",
@@ -193,15 +234,40 @@ class QueryPad(Container):
         ]
         if analysis.errors:
             lines.append(f"Errors: {analysis.errors[0]}")
-        self._analysis_panel.update("\n".join(lines))
+        self._queue_update(self._analysis_panel, "\n".join(lines))
 
     def _render_metadata_status(self) -> None:
         if not self._metadata_panel:
             return
-        tables = ", ".join(sorted(self._metadata_snapshot)) or "No tables loaded"
-        self._metadata_panel.update(f"Metadata tables: {tables}")
+        snapshot = self._metadata_snapshot
+        # Snapshots are immutable; the same object means the same sorted listing.
+        if snapshot is self._metadata_rendered:
+            return
+        self._metadata_rendered = snapshot
+        tables = ", ".join(sorted(snapshot)) or "No tables loaded"
+        self._queue_update(self._metadata_panel, f"Metadata tables: {tables}")
+
+    def _queue_update(self, panel: Static, text: str) -> None:
+        # Panels written in the same frame share one refresh; only the latest text lands.
+        if self._rendered_text.get(panel) == text:
+            # Identical to what is on screen (common while typing an identifier).
+            self._pending_render.pop(panel, None)
+            return
+        self._pending_render[panel] = text
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.call_after_refresh(self._flush_renders)
+
+    def _flush_renders(self) -> None:
+        pending, self._pending_render = self._pending_render, {}
+        self._flush_scheduled = False
+        for panel, text in pending.items():
+            self._rendered_text[panel] = text
+            panel.update(text)
 
     def _handle_session_update(self, state: SessionState) -> None:
+        if state.metadata is self._metadata_snapshot:
+            return
         self._metadata_snapshot = state.metadata
         self._render_metadata_status()
 
@@ -222,12 +288,15 @@ class QueryPad(Container):
         if not columns:
             return
         self._result_table.add_columns(*columns)
-        for row in result.rows[: self._result_limit]:
-            values = list(row[:col_count])
-            if len(values) < col_count:
-                values.extend([""] * (col_count - len(values)))
-            display = [self._format_cell(value) for value in values]
-            self._result_table.add_row(*display)
+        rows = result.rows[: self._result_limit]
+        # Result rows are normally rectangular; only pad when a short row shows up.
+        if any(len(row) < col_count for row in rows):
+            padding = ("",) * col_count
+            rows = tuple(row[:col_count] + padding[len(row) :] for row in rows)
+        # One add_rows call refreshes the table once instead of once per row.
+        self._result_table.add_rows(
+            [_format_cell(value) for value in row[:col_count]] for row in rows
+        )
 
     def _set_status(self, message: str, *, severity: str) -> None:
         if not self._status_panel:
@@ -240,35 +309,32 @@ class QueryPad(Container):
         }.get(severity, "•")
         self._status_panel.update(f"{prefix} {message}")
 
-    @staticmethod
-    def _format_cell(value: object) -> str:
-        if value is None:
-            return "NULL"
-        if isinstance(value, (int, float)):
-            return str(value)
-        if isinstance(value, bool):
-            return "TRUE" if value else "FALSE"
-        return str(value)
-
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "run-query":
             await self._execute_current_query()
 
-    async def action_run_query(self) -> None:
-        await self._execute_current_query()
+
+# Keyed on the exact type so bool is not swallowed by int; everything else uses str().
+_CELL_FORMATTERS: dict[type, Callable[[object], str]] = {
+    type(None): lambda _: "NULL",
+    bool: lambda value: "TRUE" if value else "FALSE",
+}
+
+
+def _format_cell(value: object) -> str:
+    formatter = _CELL_FORMATTERS.get(type(value))
+    return formatter(value) if formatter is not None else str(value)
 
 
 class QueryRunRequested(Message):
     """Message fired when the input requests a query run."""
 
-    pass
+    __slots__ = ()
 
 
 class _QueryInput(Input):
     """Input wrapper that detects Ctrl+Enter/newline chords."""
 
-    _TRIGGER_KEYS = {"ctrl+enter", "ctrl+j", "newline"}
-
     def __init__(
         self,
         *args: object,
@@ -279,13 +345,15 @@ class _QueryInput(Input):
         self._on_query = on_query
 
     def _on_key(self, event: events.Key) -> None:
-        key = event.key or ""
-        ctrl_enter = key == "enter" and bool(getattr(event, "control", False))
-        if (key in self._TRIGGER_KEYS or ctrl_enter) and self._on_query:
-            self._on_query()
-            event.stop()
+        # Textual dispatches Input._on_key itself (handlers run along the MRO), so
+        # ordinary keys need no super() call here.
+        on_query = self._on_query
+        if on_query is None:
             return
-        super()._on_key(event)
+        key = event.key
+        if key in _TRIGGER_KEYS or (key == "enter" and getattr(event, "control", False)):
+            on_query()
+            event.stop()
 
 
 __all__ = ["QueryPad"]
@@ -7,6 +7,7 @@ from typing import Callable
 from textual import events
 from textual.app import ComposeResult
 from textual.containers import Container
+from textual.timer import Timer
 from textual.widgets import Static
 
 from psqlui.session import SessionManager
@@ -15,6 +16,8 @@ from .navigation_sidebar import NavigationSidebar
 
 MIN_WIDTH = 18
 MAX_WIDTH = 64
+_RESIZE_FRAME = 1 / 60
+_PERSIST_DELAY = 0.3
 
 
 class SidebarPanel(Container):
@@ -33,18 +36,19 @@ class SidebarPanel(Container):
         min-height: 100%;
         background: $surface-darken-2;
         color: $text-muted;
-        transition: background 120ms, color 120ms;
     }
 
     SidebarResizeHandle.hover {
         background: $surface-darken-1;
         color: $text;
+        transition: background 120ms, color 120ms;
     }
 
     SidebarResizeHandle.dragging,
     SidebarPanel.resizing SidebarResizeHandle {
         background: $primary;
         color: $text;
+        transition: background 0ms, color 0ms;
     }
     """
 
@@ -62,6 +66,10 @@ class SidebarPanel(Container):
         self._resizing = False
         self._start_x = 0
         self._start_width = self._width
+        self._pending_width: int | None = None
+        self._applied_width: int | None = None
+        self._frame_timer: Timer | None = None
+        self._persist_timer: Timer | None = None
         self.styles.flex = "0 0 auto"
 
     @property
@@ -84,17 +92,49 @@ class SidebarPanel(Container):
             return
         delta = screen_x - self._start_x
         new_width = max(MIN_WIDTH, min(MAX_WIDTH, self._start_width + delta))
-        self._apply_width(new_width)
+        # Mouse moves outpace redraws; apply only the latest width once per frame.
+        self._pending_width = new_width
+        if self._frame_timer is None:
+            self._frame_timer = self.set_timer(_RESIZE_FRAME, self._flush_resize)
 
     def end_resize(self) -> None:
         if not self._resizing:
             return
+        self._flush_resize()
         self._resizing = False
         self.set_class(False, "resizing")
+        # Back-to-back drags settle into a single persisted width.
+        if self._persist_timer is not None:
+            self._persist_timer.stop()
+        self._persist_timer = self.set_timer(_PERSIST_DELAY, self.flush_persist)
+
+    def flush_persist(self) -> None:
+        """Report a pending width change immediately instead of waiting for the timer."""
+
+        if self._persist_timer is None:
+            return
+        self._persist_timer.stop()
+        self._persist_timer = None
         self._on_width_change(int(self._width))
 
+    def on_unmount(self) -> None:
+        self.flush_persist()
+
+    def _flush_resize(self) -> None:
+        if self._frame_timer is not None:
+            self._frame_timer.stop()
+            self._frame_timer = None
+        width, self._pending_width = self._pending_width, None
+        if width is not None:
+            self._apply_width(width)
+
     def _apply_width(self, width: int) -> None:
         self._width = width
+        # Drags pinned at MIN/MAX_WIDTH keep producing the same width; each style
+        # write would otherwise invalidate layout again.
+        if width == self._applied_width:
+            return
+        self._applied_width = width
         self.sidebar.styles.width = width
         self.sidebar.styles.min_width = width
         self.sidebar.styles.max_width = width
@@ -115,11 +155,13 @@ class SidebarResizeHandle(Static):
     def __init__(self, panel: SidebarPanel) -> None:
         super().__init__("||", id="sidebar-resize-handle")
         self._panel = panel
+        self._hover = False
+        self._dragging = False
 
     def on_mouse_down(self, event: events.MouseDown) -> None:
         self.capture_mouse()
         self._panel.begin_resize(event.screen_x)
-        self.set_class(True, "dragging")
+        self._set_dragging(True)
 
     def on_mouse_move(self, event: events.MouseMove) -> None:
         if self._panel.resizing:
@@ -128,15 +170,27 @@ class SidebarResizeHandle(Static):
     def on_mouse_up(self, event: events.MouseUp) -> None:
         self.release_mouse()
         self._panel.end_resize()
-        self.set_class(False, "dragging")
+        self._set_dragging(False)
 
     def on_mouse_enter(self, event: events.MouseEnter) -> None:  # pragma: no cover - UI affordance
-        self.set_class(True, "hover")
+        self._set_hover(True)
 
     def on_mouse_leave(self, event: events.MouseLeave) -> None:  # pragma: no cover - UI affordance
-        self.set_class(False, "hover")
+        self._set_hover(False)
         if not self._panel.resizing:
-            self.set_class(False, "dragging")
+            self._set_dragging(False)
+
+    def _set_hover(self, hover: bool) -> None:
+        # Enter/leave can repeat as the pointer crosses cells; only touch the
+        # class (and rerun the CSS cascade) when the state actually flips.
+        if hover != self._hover:
+            self._hover = hover
+            self.set_class(hover, "hover")
+
+    def _set_dragging(self, dragging: bool) -> None:
+        if dragging != self._dragging:
+            self._dragging = dragging
+            self.set_class(dragging, "dragging")
 
 
 __all__ = ["SidebarPanel"]
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Callable
 
+from textual.timer import Timer
 from textual.widgets import Static
 
 from psqlui.session import SessionManager, SessionState
 
+_RENDER_DELAY = 1 / 60
+
 
 class StatusBar(Static):
     """Compact status strip rendered above Textual's footer."""
@@ -25,6 +29,15 @@ class StatusBar(Static):
         super().__init__("", id="status-bar")
         self._session_manager = session_manager
         self._unsubscribe: Callable[[], None] | None = None
+        self._counted_metadata: Mapping[str, tuple[str, ...]] | None = None
+        self._schema_count = 0
+        self._pending_state: SessionState | None = None
+        self._flush_timer: Timer | None = None
+        self._head_key: tuple[str, str, int, int] | None = None
+        self._head = ""
+        self._refreshed_second: int | None = None
+        self._refreshed = ""
+        self._last_text: str | None = None
 
     async def on_mount(self) -> None:
         self._unsubscribe = self._session_manager.subscribe(self._handle_session_update)
@@ -33,26 +46,58 @@ class StatusBar(Static):
         if self._unsubscribe:
             self._unsubscribe()
             self._unsubscribe = None
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self._pending_state = None
 
     def _handle_session_update(self, state: SessionState) -> None:
-        tables = len(state.metadata)
-        schemas = len({table.split(".")[0] if "." in table else "public" for table in state.metadata})
+        # Reconnect cascades emit several updates back to back; render the last one.
+        self._pending_state = state
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(_RENDER_DELAY, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_timer = None
+        state, self._pending_state = self._pending_state, None
+        if state is not None:
+            self._render_state(state)
+
+    def _render_state(self, state: SessionState) -> None:
+        metadata = state.metadata
+        tables = len(metadata)
+        schemas = state.schema_count
+        if schemas is None:
+            # States built outside SessionManager may not carry the count.
+            if metadata is not self._counted_metadata:
+                self._counted_metadata = metadata
+                self._schema_count = len(
+                    {table.split(".")[0] if "." in table else "public" for table in metadata}
+                )
+            schemas = self._schema_count
         status = state.status or ("Connected" if state.connected else "Idle")
         latency = f"{state.latency_ms} ms" if state.latency_ms is not None else "—"
-        refreshed = state.refreshed_at.astimezone().strftime("%H:%M:%S")
-        backend = state.backend_label or ("Demo fallback" if state.using_fallback else "Primary backend")
-        parts = [
-            f"Profile: {state.profile.name}",
-            f"Backend: {backend}",
-            f"Schemas: {schemas}",
-            f"Tables: {tables}",
-            f"Status: {status} ({latency})",
-            f"Refreshed: {refreshed}",
-        ]
+        backend = state.backend_label or (
+            "Demo fallback" if state.using_fallback else "Primary backend"
+        )
+        # Profile/backend/counts only move on profile switches and metadata refreshes.
+        head_key = (state.profile.name, backend, schemas, tables)
+        if head_key != self._head_key:
+            self._head_key = head_key
+            self._head = f"Profile: {state.profile.name} | Backend: {backend} | Schemas: {schemas} | Tables: {tables}"
+        # The clock shows whole seconds, so refreshes within one second share a string.
+        refreshed_second = int(state.refreshed_at.timestamp())
+        if refreshed_second != self._refreshed_second:
+            self._refreshed_second = refreshed_second
+            self._refreshed = state.refreshed_at.astimezone().strftime("%H:%M:%S")
+        text = f"{self._head} | Status: {status} ({latency}) | Refreshed: {self._refreshed}"
         if state.last_error:
             reason = state.last_error.splitlines()[0][:80]
-            parts.append(f"Error: {reason}")
-        self.update(" | ".join(parts))
+            text += f" | Error: {reason}"
+        if text == self._last_text:
+            return
+        self._last_text = text
+        self.update(text)
 
 
 __all__ = ["StatusBar"]
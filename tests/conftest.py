@@ -5,6 +5,15 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if PROJECT_ROOT.as_posix() not in sys.path:
     sys.path.insert(0, PROJECT_ROOT.as_posix())
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run every anyio test on the plain asyncio backend."""
+
+    return "asyncio"
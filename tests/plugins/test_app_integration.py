@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import importlib.metadata as metadata
+import tomllib
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 import pytest
@@ -20,50 +22,60 @@ ENTRY_POINT = metadata.EntryPoint(
     value="examples.plugins.hello_world:HelloWorldPlugin",
     group="psqlui.plugins",
 )
+ENTRY_POINTS = metadata.EntryPoints((ENTRY_POINT,))
 
 
-@pytest.fixture
-def anyio_backend() -> str:
-    return "asyncio"
+def _entry_points() -> metadata.EntryPoints:
+    return ENTRY_POINTS
 
 
 @pytest.fixture(autouse=True)
 def fake_entry_points(monkeypatch: pytest.MonkeyPatch) -> None:
-    def _entry_points() -> metadata.EntryPoints:
-        return metadata.EntryPoints((ENTRY_POINT,))
-
     monkeypatch.setattr(metadata, "entry_points", _entry_points)
 
 
-@pytest.mark.anyio
-async def test_app_loads_enabled_plugins(monkeypatch: pytest.MonkeyPatch) -> None:
-    config = AppConfig(plugins={HelloWorldPlugin.name: True})
-    monkeypatch.setattr("psqlui.app._load_app_config", lambda: config)
+def _build_app(config: AppConfig) -> PsqluiApp:
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(metadata, "entry_points", _entry_points)
+        patch.setattr("psqlui.app._load_app_config", lambda: config)
+        return PsqluiApp()
 
-    app = PsqluiApp()
 
+@pytest.fixture(scope="module")
+async def enabled_app() -> AsyncIterator[PsqluiApp]:
+    """App with hello-world enabled, shared by tests that do not change config."""
+
+    app = _build_app(AppConfig(plugins={HelloWorldPlugin.name: True}))
     try:
-        assert app.plugin_loader.loaded
-        assert app.command_registry.list_commands()
-        assert any(widget.id == "hello-pane" for widget in app.plugin_panes)
+        yield app
     finally:
         await app.plugin_loader.shutdown()
 
 
-@pytest.mark.anyio
-async def test_app_initializes_session_manager(monkeypatch: pytest.MonkeyPatch) -> None:
-    config = AppConfig()
-    monkeypatch.setattr("psqlui.app._load_app_config", lambda: config)
-
-    app = PsqluiApp()
+@pytest.fixture(scope="module")
+async def default_app() -> AsyncIterator[PsqluiApp]:
+    """App built from the default config, shared by tests that do not persist it."""
 
+    app = _build_app(AppConfig())
     try:
-        assert app.session_manager.state is not None
-        assert app.session_manager.metadata_snapshot
+        yield app
     finally:
         await app.plugin_loader.shutdown()
 
 
+@pytest.mark.anyio
+async def test_app_loads_enabled_plugins(enabled_app: PsqluiApp) -> None:
+    assert enabled_app.plugin_loader.loaded
+    assert enabled_app.command_registry.list_commands()
+    assert any(widget.id == "hello-pane" for widget in enabled_app.plugin_panes)
+
+
+@pytest.mark.anyio
+async def test_app_initializes_session_manager(default_app: PsqluiApp) -> None:
+    assert default_app.session_manager.state is not None
+    assert default_app.session_manager.metadata_snapshot
+
+
 @pytest.mark.anyio
 async def test_profile_switch_provider_updates_active_profile(
     tmp_path: Path,
@@ -86,58 +98,49 @@ async def test_profile_switch_provider_updates_active_profile(
         target = next(hit for hit in hits if "Analytics Replica" in (hit.display or ""))
         await target.command()
         assert app.session_manager.active_profile_name == "Analytics Replica"
-        assert 'active_profile = "Analytics Replica"' in config_path.read_text()
+        assert tomllib.loads(config_path.read_text())["active_profile"] == "Analytics Replica"
     finally:
         await app.plugin_loader.shutdown()
 
 
 @pytest.mark.anyio
-async def test_session_refresh_provider_triggers_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
-    config = AppConfig()
-    monkeypatch.setattr("psqlui.app._load_app_config", lambda: config)
-
-    app = PsqluiApp()
-
-    try:
-        called = False
-        original = app.session_manager.refresh_active_profile
+async def test_session_refresh_provider_triggers_refresh(
+    default_app: PsqluiApp,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    called = False
+    original = default_app.session_manager.refresh_active_profile
 
-        def _fake_refresh() -> None:
-            nonlocal called
-            called = True
-            original()
+    def _fake_refresh() -> None:
+        nonlocal called
+        called = True
+        original()
 
-        app.session_manager.refresh_active_profile = _fake_refresh  # type: ignore[assignment]
-        provider = SessionRefreshProvider(_DummyScreen(app))
-        hits = [hit async for hit in provider.discover()]
-        assert hits
-        await hits[0].command()
-        assert called
-    finally:
-        await app.plugin_loader.shutdown()
+    # monkeypatch restores the method so the shared app stays untouched.
+    monkeypatch.setattr(default_app.session_manager, "refresh_active_profile", _fake_refresh)
+    provider = SessionRefreshProvider(_DummyScreen(default_app))
+    hits = [hit async for hit in provider.discover()]
+    assert hits
+    await hits[0].command()
+    assert called
 
 
 @pytest.mark.anyio
-async def test_refresh_action_invokes_session_manager(monkeypatch: pytest.MonkeyPatch) -> None:
-    config = AppConfig()
-    monkeypatch.setattr("psqlui.app._load_app_config", lambda: config)
+async def test_refresh_action_invokes_session_manager(
+    default_app: PsqluiApp,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    called = False
+    original = default_app.session_manager.refresh_active_profile
 
-    app = PsqluiApp()
+    def _fake_refresh() -> None:
+        nonlocal called
+        called = True
+        original()
 
-    try:
-        called = False
-        original = app.session_manager.refresh_active_profile
-
-        def _fake_refresh() -> None:
-            nonlocal called
-            called = True
-            original()
-
-        app.session_manager.refresh_active_profile = _fake_refresh  # type: ignore[assignment]
-        app.action_refresh()
-        assert called
-    finally:
-        await app.plugin_loader.shutdown()
+    monkeypatch.setattr(default_app.session_manager, "refresh_active_profile", _fake_refresh)
+    default_app.action_refresh()
+    assert called
 
 
 @pytest.mark.anyio
@@ -153,8 +156,7 @@ async def test_app_persists_sidebar_width(tmp_path: Path, monkeypatch: pytest.Mo
     finally:
         await app.plugin_loader.shutdown()
 
-    content = config_path.read_text()
-    assert "sidebar_width = 44" in content
+    assert tomllib.loads(config_path.read_text())["layout"]["sidebar_width"] == 44
 
 
 @pytest.mark.anyio
@@ -173,39 +175,23 @@ async def test_app_respects_disabled_plugins(monkeypatch: pytest.MonkeyPatch) ->
 
 
 @pytest.mark.anyio
-async def test_command_registry_executes_plugin_handler(monkeypatch: pytest.MonkeyPatch) -> None:
-    config = AppConfig(plugins={HelloWorldPlugin.name: True})
-    monkeypatch.setattr("psqlui.app._load_app_config", lambda: config)
-
-    app = PsqluiApp()
-
-    try:
-        descriptor = app.plugin_loader.loaded[0].descriptor
-        command = app.command_registry.list_commands()[0]
-        assert descriptor.executions == 0
-        await app.command_registry.execute(command.name)
-        assert descriptor.executions == 1
-    finally:
-        await app.plugin_loader.shutdown()
+async def test_command_registry_executes_plugin_handler(enabled_app: PsqluiApp) -> None:
+    descriptor = enabled_app.plugin_loader.loaded[0].descriptor
+    command = enabled_app.command_registry.list_commands()[0]
+    executions = descriptor.executions
+    await enabled_app.command_registry.execute(command.name)
+    assert descriptor.executions == executions + 1
 
 
 @pytest.mark.anyio
-async def test_plugin_command_provider_surfaces_hits(monkeypatch: pytest.MonkeyPatch) -> None:
-    config = AppConfig(plugins={HelloWorldPlugin.name: True})
-    monkeypatch.setattr("psqlui.app._load_app_config", lambda: config)
-
-    app = PsqluiApp()
-
-    try:
-        provider = PluginCommandProvider(_DummyScreen(app))
-        hits = [hit async for hit in provider.search("hello")]
-        assert hits
-        descriptor = app.plugin_loader.loaded[0].descriptor
-        assert descriptor.executions == 0
-        await hits[0].command()
-        assert descriptor.executions == 1
-    finally:
-        await app.plugin_loader.shutdown()
+async def test_plugin_command_provider_surfaces_hits(enabled_app: PsqluiApp) -> None:
+    provider = PluginCommandProvider(_DummyScreen(enabled_app))
+    hits = [hit async for hit in provider.search("hello")]
+    assert hits
+    descriptor = enabled_app.plugin_loader.loaded[0].descriptor
+    executions = descriptor.executions
+    await hits[0].command()
+    assert descriptor.executions == executions + 1
 
 
 @pytest.mark.anyio
@@ -260,7 +246,9 @@ class _DummyScreen:
 
 
 @pytest.mark.anyio
-async def test_toggle_plugin_updates_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_toggle_plugin_updates_config(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     config_path = tmp_path / "config.toml"
     monkeypatch.setattr("psqlui.config.CONFIG_FILE", config_path)
     monkeypatch.setattr("psqlui.app._load_app_config", lambda: AppConfig())
@@ -269,14 +257,16 @@ async def test_toggle_plugin_updates_config(tmp_path: Path, monkeypatch: pytest.
 
     try:
         app.toggle_plugin("hello-world", False)
-        assert "hello-world = false" in config_path.read_text()
+        assert tomllib.loads(config_path.read_text())["plugins"]["hello-world"] is False
         assert not app.is_plugin_enabled("hello-world")
     finally:
         await app.plugin_loader.shutdown()
 
 
 @pytest.mark.anyio
-async def test_plugin_toggle_provider_creates_commands(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_plugin_toggle_provider_creates_commands(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     config_path = tmp_path / "config.toml"
     monkeypatch.setattr("psqlui.config.CONFIG_FILE", config_path)
     monkeypatch.setattr("psqlui.app._load_app_config", lambda: AppConfig())
@@ -14,21 +14,14 @@ ENTRY_POINT = metadata.EntryPoint(
     value="examples.plugins.hello_world:HelloWorldPlugin",
     group="psqlui.plugins",
 )
-
-
-@pytest.fixture
-def anyio_backend() -> str:
-    return "asyncio"
+ENTRY_POINTS = metadata.EntryPoints((ENTRY_POINT,))
 
 
 @pytest.fixture(autouse=True)
 def fake_entry_points(monkeypatch: pytest.MonkeyPatch) -> None:
     """Force discovery to use the sample plugin."""
 
-    def _entry_points() -> metadata.EntryPoints:
-        return metadata.EntryPoints((ENTRY_POINT,))
-
-    monkeypatch.setattr(metadata, "entry_points", _entry_points)
+    monkeypatch.setattr(metadata, "entry_points", lambda: ENTRY_POINTS)
 
 
 def test_discover_returns_plugin_metadata() -> None:
@@ -65,6 +58,27 @@ def test_disabled_plugin_is_skipped() -> None:
     assert loaded == []
 
 
+def test_discovery_defers_import_until_plugin_is_enabled() -> None:
+    loader = PluginLoader(PluginContext(), enabled_plugins={"other"})
+
+    loader.load()
+
+    assert loader.discovered[0].name == HelloWorldPlugin.name
+    assert not loader.discovered[0].resolved
+
+
+def test_entry_point_name_must_match_descriptor_name(monkeypatch: pytest.MonkeyPatch) -> None:
+    alias = metadata.EntryPoint(name="greeter", value=ENTRY_POINT.value, group=ENTRY_POINT.group)
+    monkeypatch.setattr(metadata, "entry_points", lambda: metadata.EntryPoints((alias,)))
+    loader = PluginLoader(PluginContext(), builtin_plugins=[HelloWorldPlugin])
+
+    loaded = loader.load()
+
+    assert [plugin.name for plugin in loaded] == [HelloWorldPlugin.name]
+    assert isinstance(loaded[0].descriptor, HelloWorldPlugin)
+    assert loaded[0].entry_point.name == HelloWorldPlugin.name
+
+
 def test_incompatible_plugin_is_skipped(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(HelloWorldPlugin, "min_core", "9.9.9")
     loader = PluginLoader(PluginContext(), core_version="0.1.0")
@@ -85,6 +99,26 @@ async def test_shutdown_invokes_plugin_hook() -> None:
     assert descriptor.shutdown_called
 
 
+def test_discovery_reuses_resolved_entry_point(monkeypatch: pytest.MonkeyPatch) -> None:
+    PluginLoader.invalidate_cache()
+    calls: list[str] = []
+    original = metadata.EntryPoint.load
+
+    def _counting_load(self: metadata.EntryPoint) -> object:
+        calls.append(self.value)
+        return original(self)
+
+    monkeypatch.setattr(metadata.EntryPoint, "load", _counting_load)
+
+    PluginLoader(PluginContext()).load()
+    PluginLoader(PluginContext()).load()
+    assert calls == [ENTRY_POINT.value]
+
+    PluginLoader.invalidate_cache()
+    PluginLoader(PluginContext()).load()
+    assert calls == [ENTRY_POINT.value, ENTRY_POINT.value]
+
+
 def test_builtin_plugin_is_discovered(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(metadata, "entry_points", lambda: metadata.EntryPoints(()))
     loader = PluginLoader(PluginContext(), builtin_plugins=[HelloWorldPlugin])
@@ -93,6 +127,8 @@ def test_builtin_plugin_is_discovered(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert discovered
     assert discovered[0].name == HelloWorldPlugin.name
+
+
 def test_disable_list_skips_plugins() -> None:
     loader = PluginLoader(PluginContext(), disabled_plugins={"hello-world"})
 
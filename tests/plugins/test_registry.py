@@ -7,11 +7,6 @@ import pytest
 from psqlui.plugins import CommandCapability, PluginCommandRegistry
 
 
-@pytest.fixture
-def anyio_backend() -> str:
-    return "asyncio"
-
-
 def _command(handler):
     return CommandCapability(name="hello", description="say hi", handler=handler)
 
@@ -61,3 +56,18 @@ async def test_execute_handles_async_handler() -> None:
     await registry.execute("hello")
 
     assert executed == ["async"]
+
+
+@pytest.mark.anyio
+async def test_execute_awaits_awaitable_from_sync_handler() -> None:
+    executed: list[str] = []
+
+    async def _work() -> None:
+        executed.append("wrapped")
+
+    registry = PluginCommandRegistry()
+    registry.register(_command(lambda: _work()))
+
+    await registry.execute("hello")
+
+    assert executed == ["wrapped"]
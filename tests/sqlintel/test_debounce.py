@@ -0,0 +1,118 @@
+"""Tests for the editor debounce helper."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import pytest
+
+from psqlui.sqlintel.debounce import Debouncer
+
+
+class _Timer:
+    def __init__(self, when: float, callback: Callable[[], None]) -> None:
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _ManualClock:
+    """Stands in for the loop's clock and timers so tests decide when time passes."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._now = 0.0
+        self._timers: list[_Timer] = []
+
+    def is_closed(self) -> bool:
+        return False
+
+    def time(self) -> float:
+        return self._now
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> _Timer:
+        timer = _Timer(self._now + delay, callback)
+        self._timers.append(timer)
+        return timer
+
+    def create_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        return self._loop.create_task(coro)
+
+    async def advance(self, seconds: float) -> None:
+        target = self._now + seconds
+        while True:
+            self._timers = [timer for timer in self._timers if not timer.cancelled]
+            due = [timer for timer in self._timers if timer.when <= target]
+            if not due:
+                break
+            timer = min(due, key=lambda entry: entry.when)
+            self._timers.remove(timer)
+            self._now = max(self._now, timer.when)
+            timer.callback()
+        self._now = target
+        # Let tasks started by fired timers run to completion.
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+
+def _debouncer(delay: float, *, leading: bool = False) -> tuple[Debouncer, _ManualClock]:
+    debouncer = Debouncer(delay=delay, leading=leading)
+    clock = _ManualClock()
+    debouncer._loop = clock  # type: ignore[assignment]
+    return debouncer, clock
+
+
+@pytest.mark.anyio
+async def test_debouncer_runs_only_latest_submission() -> None:
+    debouncer, clock = _debouncer(0.02)
+    calls: list[int] = []
+
+    for value in range(5):
+
+        async def _record(value: int = value) -> None:
+            calls.append(value)
+
+        debouncer.submit(_record)
+        await clock.advance(0.005)
+    assert calls == []
+    await clock.advance(0.06)
+
+    assert calls == [4]
+
+
+@pytest.mark.anyio
+async def test_debouncer_cancel_drops_pending_call() -> None:
+    debouncer, clock = _debouncer(0.01)
+    calls: list[str] = []
+
+    async def _record() -> None:
+        calls.append("ran")
+
+    debouncer.submit(_record)
+    debouncer.cancel()
+    await clock.advance(0.03)
+
+    assert calls == []
+
+
+@pytest.mark.anyio
+async def test_leading_debouncer_runs_first_and_latest_submission() -> None:
+    debouncer, clock = _debouncer(0.02, leading=True)
+    calls: list[int] = []
+
+    for value in range(5):
+
+        async def _record(value: int = value) -> None:
+            calls.append(value)
+
+        debouncer.submit(_record)
+        await clock.advance(0.005)
+    assert calls == [0]
+    await clock.advance(0.06)
+
+    assert calls == [0, 4]
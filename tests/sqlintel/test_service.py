@@ -7,6 +7,7 @@ import pytest
 from psqlui.sqlintel import (
     Clause,
     DiagnosticSeverity,
+    KeywordCatalog,
     LintMode,
     SqlIntelService,
     StaticMetadataProvider,
@@ -14,11 +15,6 @@ from psqlui.sqlintel import (
 )
 
 
-@pytest.fixture
-def anyio_backend() -> str:
-    return "asyncio"
-
-
 @pytest.mark.anyio
 async def test_analyze_extracts_clause_tables_and_columns() -> None:
     sql = "SELECT account_id FROM public.orders WHERE account_id = 1"
@@ -79,7 +75,9 @@ async def test_function_suggestions_available_in_select_clause() -> None:
     analysis = await service.analyze(sql, len(sql))
     suggestions = await service.suggestions_from_analysis(analysis)
 
-    assert any(entry.type is SuggestionType.FUNCTION and entry.label == "COUNT" for entry in suggestions)
+    assert any(
+        entry.type is SuggestionType.FUNCTION and entry.label == "COUNT" for entry in suggestions
+    )
 
 
 @pytest.mark.anyio
@@ -90,7 +88,9 @@ async def test_snippet_suggestions_include_limit_helper() -> None:
     analysis = await service.analyze(sql, len(sql))
     suggestions = await service.suggestions_from_analysis(analysis)
 
-    assert any(entry.type is SuggestionType.SNIPPET and "Limit 100" in entry.label for entry in suggestions)
+    assert any(
+        entry.type is SuggestionType.SNIPPET and "Limit 100" in entry.label for entry in suggestions
+    )
 
 
 @pytest.mark.anyio
@@ -106,6 +106,20 @@ async def test_metadata_updates_drive_identifier_suggestions() -> None:
     assert "public.books" in labels
 
 
+def test_metadata_update_skips_repeated_snapshot_id() -> None:
+    provider = StaticMetadataProvider({})
+    service = SqlIntelService(metadata_provider=provider)
+    snapshot = {"public.books": ("id", "title")}
+    service.update_metadata(snapshot, snapshot_id=id(snapshot))
+    rebuilt: list[object] = []
+    provider.update = rebuilt.append  # type: ignore[method-assign]
+
+    service.update_metadata(snapshot, snapshot_id=id(snapshot))
+    service.update_metadata({}, snapshot_id=None)
+
+    assert rebuilt == [{}]
+
+
 @pytest.mark.anyio
 async def test_select_star_triggers_info_lint() -> None:
     service = SqlIntelService()
@@ -114,3 +128,51 @@ async def test_select_star_triggers_info_lint() -> None:
     diagnostics = await service.lint(sql)
 
     assert any("SELECT *" in diag.message for diag in diagnostics)
+
+
+def test_catalog_lookups_return_independent_lists() -> None:
+    catalog = KeywordCatalog.default()
+
+    first = catalog.suggestions_for(Clause.WHERE)
+    first.clear()
+    second = catalog.suggestions_for(Clause.WHERE)
+
+    assert any(entry.label == "GROUP BY" for entry in second)
+    assert all(entry.label != "HAVING" for entry in second)
+
+
+@pytest.mark.anyio
+async def test_analyze_reports_tokenizer_errors_instead_of_raising() -> None:
+    service = SqlIntelService()
+    sql = "SELECT * FROM accounts WHERE email = 'abc"
+
+    analysis = await service.analyze(sql, len(sql))
+
+    assert analysis.clause is Clause.WHERE
+    assert analysis.ast is None
+    assert analysis.errors
+
+
+@pytest.mark.anyio
+async def test_analyze_reuses_parse_for_whitespace_and_cursor_changes() -> None:
+    service = SqlIntelService()
+    sql = "SELECT id FROM accounts WHERE id = 1"
+
+    first = await service.analyze(sql, len(sql))
+    second = await service.analyze(sql + "  ", 10)
+
+    assert second.ast is first.ast
+    assert second.tables == first.tables
+    assert second.clause is Clause.SELECT
+
+
+@pytest.mark.anyio
+async def test_lint_from_analysis_matches_lint() -> None:
+    service = SqlIntelService()
+    sql = "UPDATE accounts SET email = NULL"
+
+    analysis = await service.analyze(sql, len(sql))
+    diagnostics = await service.lint_from_analysis(analysis)
+
+    assert diagnostics == await service.lint(sql)
+    assert any("UPDATE statement is missing" in diag.message for diag in diagnostics)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import tomllib
 from pathlib import Path
 
 import pytest
@@ -10,6 +11,15 @@ from psqlui import config as config_module
 from psqlui.config import AppConfig, ConnectionProfileConfig, LayoutState, load_config, save_config
 
 
+@pytest.fixture
+def config_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point CONFIG_FILE at a per-test file so tests never share on-disk state."""
+
+    path = tmp_path / "config.toml"
+    monkeypatch.setattr(config_module, "CONFIG_FILE", path)
+    return path
+
+
 def test_enabled_plugins_returns_none_when_unset() -> None:
     config = AppConfig()
 
@@ -29,17 +39,13 @@ def test_enabled_plugins_can_disable_all() -> None:
     assert config.disabled_plugins() == {"hello-world"}
 
 
-def test_load_config_returns_defaults_when_missing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(config_module, "CONFIG_FILE", tmp_path / "config.toml")
-
+def test_load_config_returns_defaults_when_missing(config_path: Path) -> None:
     result = load_config()
 
     assert result == AppConfig()
 
 
-def test_load_config_reads_values(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    config_path = tmp_path / "config.toml"
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+def test_load_config_reads_values(config_path: Path) -> None:
     config_path.write_text(
         """
 theme = "light"
@@ -61,7 +67,6 @@ metadata_key = "demo"
 sidebar_width = 30
 """
     )
-    monkeypatch.setattr(config_module, "CONFIG_FILE", config_path)
 
     result = load_config()
 
@@ -73,16 +78,33 @@ sidebar_width = 30
     assert result.layout.sidebar_width == 30
 
 
-def test_load_config_handles_toml_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    config_path = tmp_path / "config.toml"
+def test_load_config_handles_toml_errors(config_path: Path) -> None:
     config_path.write_text("theme = [unterminated")
-    monkeypatch.setattr(config_module, "CONFIG_FILE", config_path)
 
     result = load_config()
 
     assert result == AppConfig()
 
 
+def test_load_config_reflects_saved_changes(config_path: Path) -> None:
+    save_config(AppConfig(theme="light"))
+    first = load_config()
+    save_config(AppConfig(theme="amber"))
+    second = load_config()
+
+    assert first.theme == "light"
+    assert second.theme == "amber"
+    assert load_config().layout is not second.layout
+
+
+def test_load_config_ignores_stale_cache(config_path: Path) -> None:
+    save_config(AppConfig(theme="light"))
+
+    config_path.write_text('theme = "solarized"\n')
+
+    assert load_config().theme == "solarized"
+
+
 def test_with_plugin_enabled_toggles_flags() -> None:
     config = AppConfig(plugins={})
 
@@ -92,10 +114,7 @@ def test_with_plugin_enabled_toggles_flags() -> None:
     assert restored.disabled_plugins() == set()
 
 
-def test_save_config_persists_values(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    config_path = tmp_path / "config.toml"
-    monkeypatch.setattr(config_module, "CONFIG_FILE", config_path)
-
+def test_save_config_persists_values(config_path: Path) -> None:
     save_config(
         AppConfig(
             theme="light",
@@ -115,16 +134,13 @@ def test_save_config_persists_values(tmp_path: Path, monkeypatch: pytest.MonkeyP
         )
     )
 
-    content = config_path.read_text()
-    assert 'theme = "light"' in content
-    assert "telemetry_enabled = true" in content
-    assert 'active_profile = "Local Demo"' in content
-    assert "[layout]" in content
-    assert "sidebar_width = 32" in content
-    assert "[[profiles]]" in content
-    assert 'name = "Local Demo"' in content
-    assert "[plugins]" in content
-    assert "hello-world = false" in content
+    saved = tomllib.loads(config_path.read_text())
+    assert saved["theme"] == "light"
+    assert saved["telemetry_enabled"] is True
+    assert saved["active_profile"] == "Local Demo"
+    assert saved["layout"] == {"sidebar_width": 32}
+    assert saved["profiles"][0]["name"] == "Local Demo"
+    assert saved["plugins"] == {"hello-world": False}
 
 
 def test_with_active_profile_updates_field() -> None:
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import pytest
 
-from psqlui.connections import AsyncpgConnectionBackend, ConnectionBackendError, DemoConnectionBackend
+from psqlui.connections import (
+    AsyncpgConnectionBackend,
+    ConnectionBackendError,
+    DemoConnectionBackend,
+    shutdown_shared_loop,
+)
 from psqlui.session import ConnectionProfile
 
 
@@ -32,22 +40,88 @@ def test_backend_cycles_metadata_snapshots() -> None:
     assert snapshots[0] == ("id", "email")
 
 
+def test_backend_shares_equal_column_lists() -> None:
+    backend = DemoConnectionBackend(
+        {
+            "demo": (
+                {"public.accounts": ("id", "email"), "public.users": ["id", "email"]},
+                {"public.accounts": ("id", "email")},
+            )
+        }
+    )
+    profile = ConnectionProfile(name="Local", metadata_key="demo")
+    seen: list[tuple[str, ...]] = []
+    backend.subscribe(lambda _, ev: seen.append(ev.metadata["public.accounts"]))
+
+    first = backend.connect(profile).metadata
+    backend.refresh(profile)
+
+    assert first["public.accounts"] is first["public.users"]
+    assert seen[-1] is first["public.accounts"]
+
+
+def test_default_backends_share_normalized_presets() -> None:
+    profile = ConnectionProfile(name="Local", metadata_key="demo")
+
+    first = DemoConnectionBackend().connect(profile)
+    second = DemoConnectionBackend().connect(profile)
+
+    assert first.metadata is second.metadata
+
+
+def test_profiles_with_inline_metadata_are_hashable() -> None:
+    profile = ConnectionProfile(name="Inline", metadata={"public.accounts": ("id",)})
+    same = ConnectionProfile(name="Inline", metadata={"public.accounts": ("id",)})
+
+    assert {profile: 1}[same] == 1
+
+
+def test_backend_reuses_read_only_inline_snapshots() -> None:
+    backend = DemoConnectionBackend()
+    profile = ConnectionProfile(name="Inline", metadata={"public.accounts": ("id",)})
+
+    first = backend.connect(profile).metadata
+    seen: list[object] = []
+    backend.subscribe(lambda _, ev: seen.append(ev.metadata))
+    backend.refresh(profile)
+
+    assert seen == [first] and seen[0] is first
+    with pytest.raises(TypeError):
+        first["public.orders"] = ("id",)  # type: ignore[index]
+
+
 class _FakeConnection:
     def __init__(self, snapshots: list[list[dict[str, str]]]) -> None:
         self._snapshots = snapshots
         self._call = 0
 
-    async def fetch(self, query: str) -> list[dict[str, str]]:
-        assert "information_schema" in query
-        if "schemata" in query:
-            # Surface at least the public schema so empty DBs still show it.
-            return [{"schema_name": "public"}]
+    async def fetchrow(self, query: str) -> dict[str, str]:
+        assert "json_build_object" in query and "pg_attribute" in query
         index = min(self._call, len(self._snapshots) - 1)
         self._call += 1
-        return self._snapshots[index]
+        rows = self._snapshots[index]
+        columns = {
+            "schema": [row["table_schema"] for row in rows],
+            "table": [row["table_name"] for row in rows],
+            "column": [row["column_name"] for row in rows],
+        }
+        # Surface at least the public schema so empty DBs still show it.
+        return {"payload": json.dumps({"schemas": ["public"], "columns": columns})}
 
-    async def close(self) -> None:  # pragma: no cover - nothing to clean
-        return None
+
+class _FakePool:
+    def __init__(self, conn: _FakeConnection) -> None:
+        self._conn = conn
+        self.acquired = 0
+        self.closed = False
+
+    @asynccontextmanager
+    async def acquire(self, *, timeout: float | None = None) -> AsyncIterator[_FakeConnection]:
+        self.acquired += 1
+        yield self._conn
+
+    async def close(self) -> None:
+        self.closed = True
 
 
 def test_asyncpg_backend_emits_real_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -62,16 +136,22 @@ def test_asyncpg_backend_emits_real_metadata(monkeypatch: pytest.MonkeyPatch) ->
             {"table_schema": "public", "table_name": "accounts", "column_name": "status"},
         ],
     ]
-    fake_conn = _FakeConnection(snapshots)
+    fake_pool = _FakePool(_FakeConnection(snapshots))
+    pools_created: list[dict[str, Any]] = []
 
-    async def _fake_connect(**kwargs: Any) -> _FakeConnection:
-        return fake_conn
+    async def _fake_create_pool(**kwargs: Any) -> _FakePool:
+        pools_created.append(kwargs)
+        return fake_pool
 
-    monkeypatch.setattr("psqlui.connections.asyncpg.connect", _fake_connect)
+    monkeypatch.setattr("psqlui.connections.asyncpg.create_pool", _fake_create_pool)
     backend = AsyncpgConnectionBackend()
-    profile = ConnectionProfile(name="Local", host="localhost", database="postgres", user="postgres")
+    profile = ConnectionProfile(
+        name="Local", host="localhost", database="postgres", user="postgres"
+    )
     events: list[tuple[str, ...]] = []
+    schemas: list[tuple[str, ...]] = []
     backend.subscribe(lambda _profile, event: events.append(event.metadata["public.accounts"]))
+    backend.subscribe(lambda _profile, event: schemas.append(event.schemas))
 
     event = backend.connect(profile)
 
@@ -80,15 +160,72 @@ def test_asyncpg_backend_emits_real_metadata(monkeypatch: pytest.MonkeyPatch) ->
         assert event.schemas and "public" in event.schemas
         backend.refresh(profile)
         assert events[-1] == ("id", "email", "status")
+        assert schemas[-1] is event.schemas
+        assert len(pools_created) == 1
+        assert fake_pool.acquired == 2
+    finally:
+        backend.shutdown()
+    assert fake_pool.closed
+
+
+def test_asyncpg_backend_rejects_malformed_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _RowShapedConnection(_FakeConnection):
+        async def fetchrow(self, query: str) -> dict[str, str]:
+            return {"payload": json.dumps([{"table_schema": "public"}])}
+
+    async def _fake_create_pool(**kwargs: Any) -> _FakePool:
+        return _FakePool(_RowShapedConnection([[]]))
+
+    monkeypatch.setattr("psqlui.connections.asyncpg.create_pool", _fake_create_pool)
+    backend = AsyncpgConnectionBackend(payload_query="SELECT 1")
+
+    try:
+        with pytest.raises(ConnectionBackendError, match="JSON 'payload' object"):
+            backend.connect(ConnectionProfile(name="Local", host="localhost"))
+    finally:
+        backend.shutdown()
+
+
+def test_asyncpg_backends_share_one_loop() -> None:
+    first, second = AsyncpgConnectionBackend(), AsyncpgConnectionBackend()
+
+    try:
+        assert first._loop is second._loop  # type: ignore[attr-defined]
+    finally:
+        first.shutdown()
+        second.shutdown()
+    assert first._loop.is_running()  # type: ignore[attr-defined]
+
+
+def test_asyncpg_backend_survives_shared_loop_shutdown(monkeypatch: pytest.MonkeyPatch) -> None:
+    pools: list[_FakePool] = []
+
+    async def _fake_create_pool(**kwargs: Any) -> _FakePool:
+        pools.append(_FakePool(_FakeConnection([[]])))
+        return pools[-1]
+
+    monkeypatch.setattr("psqlui.connections.asyncpg.create_pool", _fake_create_pool)
+    backend = AsyncpgConnectionBackend()
+    profile = ConnectionProfile(name="Local", host="localhost")
+    backend.connect(profile)
+    old_loop = backend._loop  # type: ignore[attr-defined]
+
+    shutdown_shared_loop()
+
+    assert pools[0].closed
+    assert old_loop.is_closed()
+    try:
+        assert backend.connect(profile).schemas == ("public",)
+        assert len(pools) == 2
     finally:
         backend.shutdown()
 
 
 def test_asyncpg_backend_surfaces_connection_errors(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def _broken_connect(**kwargs: Any) -> None:
+    async def _broken_create_pool(**kwargs: Any) -> None:
         raise RuntimeError("boom")
 
-    monkeypatch.setattr("psqlui.connections.asyncpg.connect", _broken_connect)
+    monkeypatch.setattr("psqlui.connections.asyncpg.create_pool", _broken_create_pool)
     backend = AsyncpgConnectionBackend()
     profile = ConnectionProfile(name="Broken")
 
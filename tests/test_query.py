@@ -8,11 +8,6 @@ from psqlui.models import ConnectionProfile
 from psqlui.query import AsyncpgQueryExecutor, DemoQueryExecutor, QueryExecutionError
 
 
-@pytest.fixture
-def anyio_backend() -> str:
-    return "asyncio"
-
-
 class _FakeConnection:
     def __init__(self, rows=None, status: str = "INSERT 0 1") -> None:
         self.rows = rows or []
@@ -51,6 +46,7 @@ async def test_asyncpg_executor_fetches_rows(monkeypatch: pytest.MonkeyPatch) ->
     result = await executor.execute(profile, "SELECT * FROM accounts")
 
     assert result.columns == ("id", "email")
+    assert result.rows[1] == (2, "bob@example.com")
     assert result.row_count == 2
     assert connection.fetch_called is True
     assert connection.closed is True
@@ -2,27 +2,58 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import gc
+from collections.abc import Iterator, Mapping
 
 import pytest
 
 from psqlui.config import AppConfig, ConnectionProfileConfig
 from psqlui.connections import ConnectionBackendError, DemoConnectionBackend
 from psqlui.query import QueryResult
-from psqlui.session import SessionManager
+from psqlui.session import SessionManager, SessionState
 
 
-@pytest.fixture
-def anyio_backend() -> str:
-    return "asyncio"
+class _SqlIntelStub:
+    def __init__(self) -> None:
+        self.last_metadata: Mapping[str, tuple[str, ...]] | None = None
 
+    def update_metadata(self, tables, snapshot_id=None):  # type: ignore[no-untyped-def]
+        self.last_metadata = tables
 
-class _SqlIntelStub:
+
+class _CountingSqlIntelStub(_SqlIntelStub):
     def __init__(self) -> None:
-        self.last_metadata: dict[str, tuple[str, ...]] | None = None
+        super().__init__()
+        self.pushes = 0
+
+    def update_metadata(self, tables, snapshot_id=None):  # type: ignore[no-untyped-def]
+        self.pushes += 1
+        super().update_metadata(tables, snapshot_id)
+
+
+_Session = tuple[SessionManager, _SqlIntelStub]
 
-    def update_metadata(self, tables):  # type: ignore[no-untyped-def]
-        self.last_metadata = dict(tables)
+_SWITCH_PROFILES = (
+    ConnectionProfileConfig(name="Local", metadata_key="demo"),
+    ConnectionProfileConfig(name="Replica", metadata_key="analytics"),
+)
+_SWITCH_CONFIG = AppConfig(profiles=list(_SWITCH_PROFILES), active_profile="Local")
+
+
+@pytest.fixture(scope="module")
+def _shared_switch_session() -> _Session:
+    service = _SqlIntelStub()
+    return SessionManager(service, config=_SWITCH_CONFIG, backend=DemoConnectionBackend()), service
+
+
+@pytest.fixture
+def switch_session(_shared_switch_session: _Session) -> Iterator[_Session]:
+    # The manager is shared across the module; put the initial profile back.
+    manager, _ = _shared_switch_session
+    initial = manager.active_profile_name
+    yield _shared_switch_session
+    if initial is not None and manager.active_profile_name != initial:
+        manager.connect(initial)
 
 
 def test_session_manager_connects_first_profile_by_default() -> None:
@@ -41,35 +72,104 @@ def test_session_manager_connects_first_profile_by_default() -> None:
     assert manager.state.backend_label == "Primary backend"
     assert manager.state.using_fallback is False
     assert manager.state.last_error is None
-    assert service.last_metadata == dict(manager.state.metadata)
+    assert service.last_metadata is manager.state.metadata
+
+
+@pytest.mark.parametrize(
+    ("start", "target", "schema"),
+    [("Local", "Replica", "analytics"), ("Replica", "Local", "public")],
+)
+def test_session_manager_switches_profiles_and_notifies_listeners(
+    switch_session: _Session,
+    start: str,
+    target: str,
+    schema: str,
+) -> None:
+    manager, service = switch_session
+    manager.connect(start)
+    seen: list[SessionState] = []
+
+    unsubscribe = manager.subscribe(seen.append)
+    assert seen
+    manager.connect(target)
+
+    assert seen[-1].profile.name == target
+    assert seen[-2].profile.name != target
+    assert manager.state is not None and manager.state.profile.name == target
+    assert service.last_metadata is manager.state.metadata
+    assert schema in manager.state.schemas
+    assert manager.state.schemas_set == frozenset(manager.state.schemas)
+    assert seen[-1].refreshed_at >= seen[0].refreshed_at
+    assert manager.state.latency_ms is not None
+    unsubscribe()
 
 
-def test_session_manager_switches_profiles_and_notifies_listeners() -> None:
-    profiles = [
-        ConnectionProfileConfig(name="Local", metadata_key="demo"),
-        ConnectionProfileConfig(name="Replica", metadata_key="analytics"),
-    ]
-    config = AppConfig(profiles=profiles, active_profile="Local")
-    service = _SqlIntelStub()
-    manager = SessionManager(service, config=config, backend=DemoConnectionBackend())
+def test_session_manager_notifies_once_per_connect() -> None:
+    config = AppConfig(profiles=[ConnectionProfileConfig(name="Local", metadata_key="demo")])
+    manager = SessionManager(_SqlIntelStub(), config=config, backend=DemoConnectionBackend())
     seen: list[str] = []
-    timestamps: list[datetime] = []
+    manager.subscribe(lambda state: seen.append(state.status))
+    seen.clear()
 
-    def _listener(state):
-        seen.append(state.profile.name)
-        timestamps.append(state.refreshed_at)
+    manager.connect("Local")
+    manager.refresh_profile("Local")
 
-    unsubscribe = manager.subscribe(_listener)
-    assert timestamps
-    manager.connect("Replica")
+    assert len(seen) == 2
 
-    assert seen[-1] == "Replica"
-    assert manager.state is not None and manager.state.profile.name == "Replica"
-    assert service.last_metadata == dict(manager.state.metadata)
-    assert "analytics" in manager.state.schemas
-    assert timestamps[-1] >= timestamps[0]
-    assert manager.state.latency_ms is not None
-    unsubscribe()
+
+def test_weak_listeners_drop_out_once_collected() -> None:
+    config = AppConfig(profiles=[ConnectionProfileConfig(name="Local", metadata_key="demo")])
+    manager = SessionManager(_SqlIntelStub(), config=config, backend=DemoConnectionBackend())
+    seen: list[str] = []
+
+    class _Widget:
+        def on_state(self, state) -> None:  # type: ignore[no-untyped-def]
+            seen.append(state.profile.name)
+
+    widget = _Widget()
+    manager.subscribe(widget.on_state, weak=True)
+    manager.connect("Local")
+    assert seen == ["Local", "Local"]
+
+    del widget
+    gc.collect()
+    manager.connect("Local")
+
+    assert seen == ["Local", "Local"]
+    assert not manager._listeners
+
+
+def test_session_manager_skips_pushing_unchanged_metadata() -> None:
+    config = AppConfig(
+        profiles=[ConnectionProfileConfig(name="Local", metadata={"public.accounts": ["id"]})]
+    )
+    service = _CountingSqlIntelStub()
+    manager = SessionManager(service, config=config, backend=DemoConnectionBackend())
+    assert manager.state is not None
+    metadata = manager.state.metadata
+    pushes = service.pushes
+
+    manager.refresh_active_profile()
+    manager.connect("Local")
+
+    assert manager.state.metadata is metadata
+    assert service.pushes == pushes
+    with pytest.raises(TypeError):
+        manager.state.metadata["public.orders"] = ("id",)  # type: ignore[index]
+
+
+def test_session_state_carries_metadata_schema_count() -> None:
+    profiles = [
+        ConnectionProfileConfig(
+            name="Local",
+            metadata={"public.accounts": ["id"], "sales.orders": ["id"], "audit": ["id"]},
+        )
+    ]
+    config = AppConfig(profiles=profiles, active_profile="Local")
+    manager = SessionManager(_SqlIntelStub(), config=config, backend=DemoConnectionBackend())
+
+    assert manager.state is not None
+    assert manager.state.schema_count == 2
 
 
 def test_session_manager_errors_on_missing_profile() -> None:
@@ -77,12 +177,8 @@ def test_session_manager_errors_on_missing_profile() -> None:
     service = _SqlIntelStub()
     manager = SessionManager(service, config=config, backend=DemoConnectionBackend())
 
-    try:
+    with pytest.raises(ValueError, match=r"Profile 'unknown' not found"):
         manager.connect("unknown")
-    except ValueError as exc:
-        assert "Profile 'unknown' not found" in str(exc)
-    else:  # pragma: no cover - defensive, should not happen
-        assert False, "Expected ValueError for missing profile"
 
 
 def test_refresh_cycle_updates_metadata() -> None:
@@ -94,7 +190,10 @@ def test_refresh_cycle_updates_metadata() -> None:
             )
         }
     )
-    config = AppConfig(profiles=[ConnectionProfileConfig(name="Local", metadata_key="demo")], active_profile="Local")
+    config = AppConfig(
+        profiles=[ConnectionProfileConfig(name="Local", metadata_key="demo")],
+        active_profile="Local",
+    )
     service = _SqlIntelStub()
     manager = SessionManager(service, config=config, backend=backend)
     lengths: list[int] = []
@@ -134,7 +233,7 @@ def test_refresh_profile_switches_and_refreshes_non_active_profile() -> None:
     assert manager.state is not None
     assert manager.state.profile.name == "Replica"
     assert manager.state.metadata["analytics.events"] == ("id", "payload")
-    assert service.last_metadata == dict(manager.state.metadata)
+    assert service.last_metadata is manager.state.metadata
     assert "analytics" in manager.state.schemas
 
 
@@ -183,20 +282,8 @@ def test_refresh_failure_switches_to_demo_and_records_error() -> None:
     profiles = [ConnectionProfileConfig(name="Local", metadata_key="demo")]
     config = AppConfig(profiles=profiles, active_profile="Local")
     service = _SqlIntelStub()
-    primary = _FlakyBackend(
-        {
-            "demo": (
-                {"public.accounts": ("id",)},
-            )
-        }
-    )
-    fallback = DemoConnectionBackend(
-        {
-            "demo": (
-                {"public.accounts": ("id", "email", "status")},
-            )
-        }
-    )
+    primary = _FlakyBackend({"demo": ({"public.accounts": ("id",)},)})
+    fallback = DemoConnectionBackend({"demo": ({"public.accounts": ("id", "email", "status")},)})
     manager = SessionManager(service, config=config, backend=primary, fallback_backend=fallback)
 
     assert manager.state is not None
@@ -209,7 +296,10 @@ def test_refresh_failure_switches_to_demo_and_records_error() -> None:
 
 @pytest.mark.anyio
 async def test_run_query_uses_primary_executor() -> None:
-    config = AppConfig(profiles=[ConnectionProfileConfig(name="Local", metadata_key="demo")], active_profile="Local")
+    config = AppConfig(
+        profiles=[ConnectionProfileConfig(name="Local", metadata_key="demo")],
+        active_profile="Local",
+    )
     service = _SqlIntelStub()
     primary_executor = _QueryStub()
     fallback_executor = _QueryStub(status="Fallback")
@@ -234,7 +324,10 @@ async def test_run_query_uses_fallback_executor_when_demo_active() -> None:
         def connect(self, profile):  # type: ignore[override]
             raise ConnectionBackendError("down")
 
-    config = AppConfig(profiles=[ConnectionProfileConfig(name="Local", metadata_key="demo")], active_profile="Local")
+    config = AppConfig(
+        profiles=[ConnectionProfileConfig(name="Local", metadata_key="demo")],
+        active_profile="Local",
+    )
     service = _SqlIntelStub()
     primary_executor = _QueryStub()
     fallback_executor = _QueryStub(status="Fallback demo")
@@ -253,10 +346,14 @@ async def test_run_query_uses_fallback_executor_when_demo_active() -> None:
     assert result.status == "Fallback demo"
     assert fallback_executor.calls == ["SELECT * FROM demo"]
     assert not primary_executor.calls
+
+
 class _QueryStub:
     def __init__(self, status: str = "OK") -> None:
         self.calls: list[str] = []
-        self.result = QueryResult(columns=("id",), rows=((1,),), status=status, elapsed_ms=1, row_count=1)
+        self.result = QueryResult(
+            columns=("id",), rows=((1,),), status=status, elapsed_ms=1, row_count=1
+        )
 
     async def execute(self, profile, sql):  # type: ignore[no-untyped-def]
         self.calls.append(sql)